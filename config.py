@@ -14,6 +14,8 @@ LARGE_DISPLAY = {
     "dc_pin": 24,
     "rst_pin": 25,
     "spi_speed_hz": 16000000,  # 16MHz
+    "cs_pin": 8,  # CE0, driven from userspace when manual_cs is on
+    "manual_cs": True,  # One CS assertion per frame instead of per transfer
 }
 
 # Small Display (ILI9341 320x240) - CE1
@@ -41,6 +43,9 @@ TOUCH = {
     "swap_xy": True,
     "invert_x": True,
     "invert_y": True,
+    # Poll slower after this many seconds without a touch:
+    # (idle seconds, poll interval seconds). Kept well under a tap's length.
+    "idle_backoff": ((5.0, 0.025), (30.0, 0.05)),
 }
 
 # Rotary Encoder (KY-040 or similar)
@@ -50,6 +55,9 @@ ROTARY_ENCODER = {
     "sw_pin": 13,
     "bouncetime_rotation": 2,   # ms - very short for responsive rotation
     "bouncetime_button": 300,   # ms - longer for button debounce
+    # Polling fallback only: (idle seconds, poll interval seconds) steps
+    # taken after the knob and button have been still for a while
+    "idle_backoff": ((0.05, 0.005), (0.5, 0.02)),
 }
 
 # 16x2 I2C Character LCD (PCF8574 expander)
@@ -203,3 +211,11 @@ CMD_PASET = 0x2B
 CMD_RAMWR = 0x2C
 CMD_MADCTL = 0x36
 CMD_COLMOD = 0x3A
+
+# MADCTL bits - rotation, mirroring and color order are done by the panel
+# controller during scan-out, so frames never need flipping or an R/B swap
+# on the CPU
+MADCTL_MY = 0x80   # Row address order (flip vertical)
+MADCTL_MX = 0x40   # Column address order (flip horizontal)
+MADCTL_MV = 0x20   # Row/column exchange (landscape)
+MADCTL_BGR = 0x08  # Panel swaps R/B so RGB bytes match BGR subpixels
@@ -5,11 +5,13 @@ Features Molty (space lobster mascot) and activity feed.
 Uses raw spidev + RPi.GPIO instead of luma.lcd.
 """
 
+import queue
+import struct
 import threading
 import time
 from datetime import datetime
 from typing import Optional, Callable, Dict, List
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 try:
     import spidev
@@ -19,8 +21,9 @@ except ImportError:
     HARDWARE_AVAILABLE = False
 
 import config
+import gpiomem
 from spi_lock import spi_lock
-from ui.cyberpunk_theme import CyberpunkTheme, COLORS
+from ui.cyberpunk_theme import CyberpunkTheme, COLORS, load_font, text_bbox
 from ui.molty import Molty, MoltyState
 from ui.activity_feed import ActivityFeed
 
@@ -47,6 +50,14 @@ class ConversationDisplay:
         self.running = False
         self.fonts = {}
 
+        # DC pin setters (bound in initialize)
+        self._dc_high = None
+        self._dc_low = None
+
+        # CE0 setters when chip select is driven manually (no-ops otherwise)
+        self._manual_cs = False
+        self._cs_high = self._cs_low = lambda: None
+
         # Cyberpunk UI components
         self.theme = CyberpunkTheme()
         self.molty = Molty(sprite_dir=config.SPRITES.get("molty_dir"))
@@ -61,6 +72,16 @@ class ConversationDisplay:
         # Refresh rate control
         self._last_render_time = 0
 
+        # Set by every state change so the render loop wakes immediately
+        self._dirty = threading.Event()
+
+        # Last frame sent to the panel (for dirty-rectangle updates)
+        self._last_frame = None
+
+        # Finished frames waiting for the SPI worker (latest frame wins)
+        self._spi_queue = queue.Queue(maxsize=1)
+        self._spi_thread = None
+
         # Legacy support for messages (kept for bridge compatibility)
         self.messages = []
         self._streaming_content = ""
@@ -69,23 +90,24 @@ class ConversationDisplay:
         self._last_cursor_toggle = time.time()
 
         self._load_fonts()
+        self._build_chrome()
 
     def _load_fonts(self):
         """Load fonts for rendering."""
         try:
-            self.fonts["regular"] = ImageFont.truetype(
+            self.fonts["regular"] = load_font(
                 config.FONTS["default_path"],
                 config.FONTS["size_medium"]
             )
-            self.fonts["small"] = ImageFont.truetype(
+            self.fonts["small"] = load_font(
                 config.FONTS["default_path"],
                 config.FONTS["size_small"]
             )
-            self.fonts["bold"] = ImageFont.truetype(
+            self.fonts["bold"] = load_font(
                 config.FONTS["bold_path"],
                 config.FONTS["size_medium"]
             )
-            self.fonts["title"] = ImageFont.truetype(
+            self.fonts["title"] = load_font(
                 config.FONTS["bold_path"],
                 config.FONTS["size_large"]
             )
@@ -115,6 +137,12 @@ class ConversationDisplay:
                 # Setup GPIO pins
                 GPIO.setup(config.LARGE_DISPLAY["dc_pin"], GPIO.OUT)
                 GPIO.setup(config.LARGE_DISPLAY["rst_pin"], GPIO.OUT)
+                self._dc_high, self._dc_low = self._bind_output_pin(config.LARGE_DISPLAY["dc_pin"])
+                if config.LARGE_DISPLAY.get("manual_cs"):
+                    cs_pin = config.LARGE_DISPLAY["cs_pin"]
+                    GPIO.setup(cs_pin, GPIO.OUT, initial=GPIO.HIGH)
+                    self._cs_high, self._cs_low = self._bind_output_pin(cs_pin)
+                    self._manual_cs = True
 
                 # Setup SPI
                 self.spi = spidev.SpiDev()
@@ -126,7 +154,13 @@ class ConversationDisplay:
 
                 # Initialize display
                 self._reset()
-                self._init_display()
+                self._cs_low()
+                try:
+                    self._init_display()
+                finally:
+                    self._cs_high()
+                self._last_frame = None
+                self._start_spi_worker()
 
                 print(f"[Display1] Initialized: {config.LARGE_DISPLAY['width']}x{config.LARGE_DISPLAY['height']} (ILI9488 18-bit)")
                 return True
@@ -140,12 +174,22 @@ class ConversationDisplay:
                     return False
         return False
 
+    def _bind_output_pin(self, pin):
+        """Return (high, low) setters, preferring direct register writes over RPi.GPIO."""
+        try:
+            out = gpiomem.OutputPin(pin)
+            return out.high, out.low
+        except (OSError, ValueError) as e:
+            print(f"[Display1] gpiomem unavailable ({e}), using RPi.GPIO for GPIO {pin}")
+            return (lambda: GPIO.output(pin, GPIO.HIGH),
+                    lambda: GPIO.output(pin, GPIO.LOW))
+
     def _restore_spi(self):
         """Restore SPI settings (needed after touch uses same bus)."""
         if self.spi:
             self.spi.max_speed_hz = config.LARGE_DISPLAY["spi_speed_hz"]
             self.spi.mode = 0
-            self.spi.no_cs = False
+            self.spi.no_cs = self._manual_cs
 
     def _reset(self):
         """Hardware reset the display."""
@@ -159,18 +203,19 @@ class ConversationDisplay:
 
     def _command(self, cmd):
         """Send command byte to display."""
-        GPIO.output(config.LARGE_DISPLAY["dc_pin"], GPIO.LOW)
-        self.spi.xfer([cmd])
+        self._dc_low()
+        self.spi.writebytes2([cmd])
 
     def _data(self, data):
         """Send data bytes to display."""
-        GPIO.output(config.LARGE_DISPLAY["dc_pin"], GPIO.HIGH)
+        self._dc_high()
         if isinstance(data, int):
-            self.spi.xfer([data])
+            self.spi.writebytes2([data])
         else:
-            data = list(data) if isinstance(data, bytes) else data
-            for i in range(0, len(data), 4096):
-                self.spi.xfer(data[i:i + 4096])
+            # writebytes2 accepts any buffer and splits it into
+            # spidev.bufsiz-sized transfers in C (write-only, no readback),
+            # releasing the GIL around each write()
+            self.spi.writebytes2(data)
 
     def _init_display(self):
         """Initialize ILI9488 display."""
@@ -180,23 +225,66 @@ class ConversationDisplay:
         time.sleep(0.15)
         self._command(config.CMD_COLMOD)
         self._data(0x66)  # 18-bit color
+        # Landscape, flipped 180°, BGR panel fed RGB bytes (0xE8)
         self._command(config.CMD_MADCTL)
-        self._data(0xE8)  # Landscape + BGR (flipped 180°)
+        self._data(config.MADCTL_MY | config.MADCTL_MX | config.MADCTL_MV | config.MADCTL_BGR)
         self._command(config.CMD_NORON)
         time.sleep(0.01)
         self._command(config.CMD_DISPON)
         time.sleep(0.01)
 
+    def _write_sequence(self, seq):
+        """
+        Send a sequence of (is_data, payload) pairs to the display.
+
+        Consecutive payloads at the same DC level are joined into a single
+        transfer. DC can't change inside one spidev transfer, so one write
+        per DC run is the minimum the bus allows.
+        """
+        run_level = None
+        run = []
+        for level, payload in seq:
+            if level != run_level and run:
+                self._write_run(run_level, run)
+                run = []
+            run_level = level
+            run.append(payload)
+        if run:
+            self._write_run(run_level, run)
+
+    def _write_run(self, is_data, payloads):
+        """Set DC and send payloads as one transfer."""
+        if is_data:
+            self._dc_high()
+        else:
+            self._dc_low()
+        self.spi.writebytes2(payloads[0] if len(payloads) == 1 else b"".join(payloads))
+
+    def _window_sequence(self, x0, y0, x1, y1):
+        """Build the CASET/PASET/RAMWR sequence for a drawing window."""
+        return [
+            (False, bytes((config.CMD_CASET,))),
+            (True, struct.pack(">HH", x0, x1)),
+            (False, bytes((config.CMD_PASET,))),
+            (True, struct.pack(">HH", y0, y1)),
+            (False, bytes((config.CMD_RAMWR,))),
+        ]
+
     def _set_window(self, x0, y0, x1, y1):
         """Set the drawing window."""
-        self._command(config.CMD_CASET)
-        self._data([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
-        self._command(config.CMD_PASET)
-        self._data([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
-        self._command(config.CMD_RAMWR)
+        self._write_sequence(self._window_sequence(x0, y0, x1, y1))
 
     def _display_image(self, img):
-        """Display PIL image on the ILI9488 (18-bit color)."""
+        """
+        Display PIL image on the ILI9488 (18-bit color).
+
+        Only the bounding box of pixels that changed since the previous frame
+        is sent; an identical frame skips the SPI transfer entirely.
+
+        Once the write completes the image becomes the reference for the next
+        diff, so the caller must not modify it afterwards (render() hands over
+        its own copy).
+        """
         width = config.LARGE_DISPLAY["width"]
         height = config.LARGE_DISPLAY["height"]
 
@@ -205,14 +293,77 @@ class ConversationDisplay:
         if img.mode != 'RGB':
             img = img.convert('RGB')
 
-        self._set_window(0, 0, width - 1, height - 1)
-        pixels = img.tobytes()
+        if self._last_frame is None:
+            bbox = (0, 0, width, height)
+        else:
+            bbox = ImageChops.difference(img, self._last_frame).getbbox()
+            if bbox is None:
+                return
+
+        region = img if bbox == (0, 0, width, height) else img.crop(bbox)
+        x0, y0, x1, y1 = bbox
+
+        # COLMOD 0x66 sends one byte per channel and the panel ignores the
+        # low 2 bits, so RGB888 bytes go out as-is (no masking pass needed).
+        # Over serial SPI this 3-byte layout is the only one the ILI9488
+        # accepts (no packed 2.25 bytes/pixel, and 16-bit 0x55 is
+        # parallel-only), so there is nothing to gain from repacking here.
+        seq = self._window_sequence(x0, y0, x1 - 1, y1 - 1)
+        seq.append((True, region.tobytes()))
+
+        # With manual CS the whole frame is one chip-select assertion
+        self._cs_low()
+        try:
+            self._write_sequence(seq)
+        finally:
+            self._cs_high()
+
+        # Only now does the panel hold this frame
+        self._last_frame = img
+
+    def _start_spi_worker(self):
+        """Start the thread that pushes finished frames over SPI."""
+        if self._spi_thread is None:
+            self._spi_thread = threading.Thread(target=self._spi_worker, daemon=True)
+            self._spi_thread.start()
+
+    def _spi_worker(self):
+        """
+        Send queued frames to the panel.
+
+        Runs beside the render loop so the next frame is composed while the
+        current one is on the wire. The dirty rectangle is computed here
+        against what was actually sent, so a frame replaced in the queue
+        before it went out loses nothing.
+        """
+        while True:
+            frame = self._spi_queue.get()
+            if frame is None:
+                break
+            try:
+                with spi_lock:
+                    self._restore_spi()
+                    self._display_image(frame)
+            except Exception as e:
+                # The panel may hold a partial frame; resend everything next time
+                self._last_frame = None
+                print(f"[Display1] SPI write error: {e}")
 
-        # Convert to 18-bit (mask lower 2 bits of each channel)
-        data = bytearray(len(pixels))
-        for i in range(len(pixels)):
-            data[i] = pixels[i] & 0xFC
-        self._data(bytes(data))
+    def _submit_frame(self, frame):
+        """Queue a frame for the SPI worker, replacing any unsent one."""
+        while True:
+            try:
+                self._spi_queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._spi_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def force_full_refresh(self):
+        """Resend the whole frame on the next render."""
+        self._last_frame = None
 
     # === Molty State Methods ===
 
@@ -224,7 +375,10 @@ class ConversationDisplay:
             state: MoltyState enum or string
         """
         with self.lock:
+            previous = self.molty.state
             self.molty.set_state(state)
+            if self.molty.state != previous:
+                self._dirty.set()
 
     def get_molty_state(self):
         """Get Molty's current state."""
@@ -244,16 +398,20 @@ class ConversationDisplay:
         """
         with self.lock:
             self.activity_feed.add_entry(type_, title, detail, status)
+            self._dirty.set()
 
     def update_latest_activity_status(self, status: str):
         """Update the status of the most recent activity."""
         with self.lock:
             self.activity_feed.update_latest_status(status)
+            self._dirty.set()
 
     def set_status_text(self, text: str):
         """Set the footer status text."""
         with self.lock:
-            self._status_text = text
+            if text != self._status_text:
+                self._status_text = text
+                self._dirty.set()
 
     def set_scroll_offset(self, offset: int):
         """Set the activity feed scroll offset.
@@ -261,8 +419,11 @@ class ConversationDisplay:
         Args:
             offset: Number of entries to scroll back (0 = newest at top)
         """
+        offset = max(0, offset)
         with self.lock:
-            self._scroll_offset = max(0, offset)
+            if offset != self._scroll_offset:
+                self._scroll_offset = offset
+                self._dirty.set()
 
     def get_scroll_offset(self) -> int:
         """Get the current scroll offset."""
@@ -284,6 +445,7 @@ class ConversationDisplay:
             # Also add to activity feed
             type_ = "message" if role == "user" else "status"
             self.activity_feed.add_entry(type_, content[:50], role)
+            self._dirty.set()
 
     def set_streaming_message(self, content: str, complete: bool = False):
         """Set streaming message (legacy support)."""
@@ -298,18 +460,21 @@ class ConversationDisplay:
                 self._streaming_content = content
                 self._is_streaming = True
                 self.molty.set_state(MoltyState.WORKING)
+            self._dirty.set()
 
     def append_streaming_chunk(self, chunk: str):
         """Append streaming chunk (legacy support)."""
         with self.lock:
             self._streaming_content += chunk
             self._is_streaming = True
+            self._dirty.set()
 
     def clear_streaming(self):
         """Clear streaming state."""
         with self.lock:
             self._streaming_content = ""
             self._is_streaming = False
+            self._dirty.set()
 
     def clear_messages(self):
         """Clear all messages and activities."""
@@ -318,27 +483,100 @@ class ConversationDisplay:
             self.activity_feed.clear()
             self._streaming_content = ""
             self._is_streaming = False
+            self._dirty.set()
 
     # === Rendering ===
 
-    def render(self):
-        """Render the cyberpunk Mission Control display."""
+    def _build_chrome(self):
+        """
+        Pre-render the static parts of the frame.
+
+        Panel backgrounds, borders, the neon title, the "MOLTY" label, the
+        corner accents and the activity feed's header/footer bars never
+        change, so they are drawn once here and pasted as the base of every
+        frame.
+        """
         width = config.LARGE_DISPLAY["width"]
         height = config.LARGE_DISPLAY["height"]
         border = config.BEZEL_BORDER
+        layout = config.CYBERPUNK_LAYOUT
 
-        # Full-size black canvas (matches bezel)
-        image = Image.new("RGB", (width, height), (0, 0, 0))
-
-        # Content area inset by border
         cw = width - 2 * border
         ch = height - 2 * border
-        content = Image.new("RGB", (cw, ch), COLORS["background"])
-        draw = ImageDraw.Draw(content, 'RGBA')
+        self._content_size = (cw, ch)
+        self._header_height = layout["header_height"]
+        self._molty_panel_width = int(layout["molty_panel_width"] * cw / width)
+
+        chrome = Image.new("RGB", (cw, ch), COLORS["background"])
+        draw = ImageDraw.Draw(chrome, 'RGBA')
+        self._draw_header_chrome(draw, chrome, 0, 0, cw, self._header_height)
+        self._draw_molty_panel_chrome(
+            draw, 0, self._header_height,
+            self._molty_panel_width, ch - self._header_height
+        )
+        self._activity_rect = (
+            self._molty_panel_width, self._header_height,
+            cw - self._molty_panel_width, ch - self._header_height
+        )
+        self.activity_feed.render_chrome(draw, self._activity_rect)
+        self._chrome = chrome
+        self._scanline_mask = self.theme.scanline_mask((cw, ch), spacing=3, opacity=20)
 
-        layout = config.CYBERPUNK_LAYOUT
-        molty_panel_width = int(layout["molty_panel_width"] * cw / width)
-        header_height = layout["header_height"]
+        # Frame buffers reused by every render() instead of reallocated
+        self._frame = Image.new("RGB", (width, height), (0, 0, 0))
+        self._content = chrome.copy()
+        self._content_draw = ImageDraw.Draw(self._content, 'RGBA')
+
+        self._build_digit_atlas(self.theme.get_font("mono", "medium"))
+
+    def _build_digit_atlas(self, font):
+        """
+        Pre-rasterize the header clock glyphs.
+
+        Each (slot, char) pair for "HH:MM:SS" is rendered once as an alpha
+        mask at its real pen position, so composing a time is a handful of
+        mask merges instead of a FreeType rasterization per frame.
+        """
+        pad = 4
+        slots = len("00:00:00")
+        left, top, right, bottom = text_bbox(font, "00:00:00")
+        size = (right + 2 * pad, bottom + 2 * pad)
+
+        atlas = {}
+        for slot in range(slots):
+            for char in "0123456789:":
+                mask = Image.new("L", size, 0)
+                ImageDraw.Draw(mask).text((pad, pad), " " * slot + char, font=font, fill=255)
+                atlas[slot, char] = mask
+        self._digit_atlas = atlas
+        self._clock_second = None
+        self._digit_atlas_pad = pad
+        self._digit_atlas_font = font
+
+    def _clock_mask(self, time_str):
+        """Compose the alpha mask for a time string from the digit atlas."""
+        atlas = self._digit_atlas
+        mask = atlas[0, time_str[0]].copy()
+        for slot in range(1, len(time_str)):
+            mask = ImageChops.lighter(mask, atlas[slot, time_str[slot]])
+        return mask
+
+    def render(self):
+        """Render the cyberpunk Mission Control display."""
+        border = config.BEZEL_BORDER
+
+        # Full-size black canvas (matches bezel); only the content area
+        # is ever overwritten, so the border stays black between frames
+        image = self._frame
+
+        # Content area inset by border, reset to the static chrome
+        cw, ch = self._content_size
+        content = self._content
+        content.paste(self._chrome)
+        draw = self._content_draw
+
+        molty_panel_width = self._molty_panel_width
+        header_height = self._header_height
 
         # === Header ===
         self._draw_header(draw, 0, 0, cw, header_height)
@@ -347,65 +585,48 @@ class ConversationDisplay:
         self._draw_molty_panel(draw, content, 0, header_height, molty_panel_width, ch - header_height)
 
         # === Right Panel (Activity Feed) ===
-        activity_x = molty_panel_width
-        activity_width = cw - molty_panel_width
-        activity_height = ch - header_height
-
         with self.lock:
             status_text = self._status_text
             scroll_offset = self._scroll_offset
 
         self.activity_feed.render(
             draw,
-            (activity_x, header_height, activity_width, activity_height),
+            self._activity_rect,
             status_text,
-            scroll_offset=scroll_offset
+            scroll_offset=scroll_offset,
+            chrome=False
         )
 
         # === Scanlines (apply over content) ===
-        self.theme.draw_scanlines(content, spacing=3, opacity=20)
+        content.paste((0, 0, 0), (0, 0), self._scanline_mask)
 
         # Paste content onto black canvas
         image.paste(content, (border, border))
 
         # Display the image
         if self.spi:
-            with spi_lock:
-                self._restore_spi()
-                self._display_image(image)
+            # The frame buffer is reused, so hand the worker its own copy
+            self._submit_frame(image.copy())
         elif self.demo_mode:
             pass
 
         return image
 
-    def _draw_header(self, draw, x, y, width, height):
-        """Draw the header bar."""
+    def _draw_header_chrome(self, draw, image, x, y, width, height):
+        """Draw the static parts of the header bar."""
         # Header background
         draw.rectangle([x, y, x + width, y + height], fill=COLORS["panel_bg"])
 
         # Title with glow
         font = self.theme.get_font("bold", "header")
-        self.theme.draw_neon_text(
-            draw, (x + 10, y + 6),
+        self.theme.paste_neon_text(
+            image, (x + 10, y + 6),
             "OPENCLAW",
             font,
             COLORS["neon_cyan"],
             glow_layers=1
         )
 
-        # Timestamp (right side)
-        time_str = datetime.now().strftime("%H:%M:%S")
-        time_font = self.theme.get_font("mono", "medium")
-        time_bbox = time_font.getbbox(time_str)
-        time_width = time_bbox[2] - time_bbox[0]
-
-        draw.text(
-            (x + width - time_width - 10, y + 7),
-            time_str,
-            font=time_font,
-            fill=COLORS["text_dim"]
-        )
-
         # Bottom border with glow
         draw.line(
             [(x, y + height - 1), (x + width, y + height - 1)],
@@ -413,8 +634,36 @@ class ConversationDisplay:
             width=1
         )
 
-    def _draw_molty_panel(self, draw, image, x, y, width, height):
-        """Draw the left panel with Molty character."""
+    def _draw_header(self, draw, x, y, width, height):
+        """Draw the dynamic parts of the header bar."""
+        time_font = self.theme.get_font("mono", "medium")
+
+        # Format and compose the timestamp only when the second rolls over
+        second = int(time.time())
+        if second != self._clock_second:
+            self._clock_second = second
+            time_str = datetime.now().strftime("%H:%M:%S")
+            time_bbox = text_bbox(time_font, time_str)
+            time_width = time_bbox[2] - time_bbox[0]
+            time_x = x + width - time_width - 10
+            mask = self._clock_mask(time_str) if time_font is self._digit_atlas_font else None
+            self._clock = (time_str, time_x, mask)
+
+        # Timestamp (right side)
+        time_str, time_x, mask = self._clock
+        if mask is not None:
+            pad = self._digit_atlas_pad
+            draw.bitmap((time_x - pad, y + 7 - pad), mask, fill=COLORS["text_dim"])
+        else:
+            draw.text(
+                (time_x, y + 7),
+                time_str,
+                font=time_font,
+                fill=COLORS["text_dim"]
+            )
+
+    def _draw_molty_panel_chrome(self, draw, x, y, width, height):
+        """Draw the static parts of the left Molty panel."""
         # Panel background
         draw.rectangle([x, y, x + width, y + height], fill=COLORS["panel_bg"])
 
@@ -425,33 +674,9 @@ class ConversationDisplay:
             width=1
         )
 
-        # Molty character (centered in panel)
-        molty_x = x + (width - 80) // 2
-        molty_y = y + 30
-
-        with self.lock:
-            self.molty.render(image, (molty_x, molty_y))
-            state_label = self.molty.get_state_label()
-            state_color = self.molty.get_state_color()
-
-        # State label below Molty
-        label_font = self.theme.get_font("bold", "medium")
-        label_bbox = label_font.getbbox(state_label)
-        label_width = label_bbox[2] - label_bbox[0]
-        label_x = x + (width - label_width) // 2
-        label_y = molty_y + 90
-
-        self.theme.draw_neon_text(
-            draw, (label_x, label_y),
-            state_label,
-            label_font,
-            state_color,
-            glow_layers=1
-        )
-
         # "MOLTY" label at bottom
         name_font = self.theme.get_font("mono", "small")
-        name_bbox = name_font.getbbox("MOLTY")
+        name_bbox = text_bbox(name_font, "MOLTY")
         name_width = name_bbox[2] - name_bbox[0]
         name_x = x + (width - name_width) // 2
         name_y = y + height - 30
@@ -475,6 +700,32 @@ class ConversationDisplay:
         draw.line([(x + 5, y + height - 5), (x + 5 + accent_len, y + height - 5)], fill=accent_color, width=2)
         draw.line([(x + 5, y + height - 5), (x + 5, y + height - 5 - accent_len)], fill=accent_color, width=2)
 
+    def _draw_molty_panel(self, draw, image, x, y, width, height):
+        """Draw Molty and the state label into the left panel."""
+        # Molty character (centered in panel)
+        molty_x = x + (width - 80) // 2
+        molty_y = y + 30
+
+        with self.lock:
+            self.molty.render(image, (molty_x, molty_y))
+            state_label = self.molty.get_state_label()
+            state_color = self.molty.get_state_color()
+
+        # State label below Molty
+        label_font = self.theme.get_font("bold", "medium")
+        label_bbox = text_bbox(label_font, state_label)
+        label_width = label_bbox[2] - label_bbox[0]
+        label_x = x + (width - label_width) // 2
+        label_y = molty_y + 90
+
+        self.theme.paste_neon_text(
+            image, (label_x, label_y),
+            state_label,
+            label_font,
+            state_color,
+            glow_layers=1
+        )
+
     # === Main Loop ===
 
     def run(self, get_messages_func=None, get_streaming_func=None, interval=None):
@@ -527,6 +778,7 @@ class ConversationDisplay:
                             if was_streaming:
                                 self.molty.set_state(MoltyState.IDLE)
 
+                self._last_render_time = time.monotonic()
                 self.render()
 
                 # Adjust refresh rate based on streaming state
@@ -534,9 +786,21 @@ class ConversationDisplay:
                     is_streaming = self._is_streaming
 
                 if is_streaming:
-                    time.sleep(streaming_interval)
+                    timeout = streaming_interval
                 else:
-                    time.sleep(normal_interval)
+                    # Wake on the next wall-clock second so the header
+                    # clock never skips a tick
+                    timeout = min(normal_interval, 1.0 - time.time() % 1.0)
+
+                # Sleep until a state change or the refresh deadline
+                self._dirty.wait(timeout)
+                self._dirty.clear()
+
+                # Coalesce bursts of updates (e.g. streaming chunks) into at
+                # most one frame per streaming interval
+                elapsed = time.monotonic() - self._last_render_time
+                if elapsed < streaming_interval:
+                    time.sleep(streaming_interval - elapsed)
 
             except Exception as e:
                 print(f"[Display1] Render error: {e}")
@@ -549,10 +813,15 @@ class ConversationDisplay:
     def stop(self):
         """Stop the render loop."""
         self.running = False
+        self._dirty.set()
 
     def cleanup(self):
         """Clean up resources."""
         self.stop()
+        if self._spi_thread:
+            self._submit_frame(None)
+            self._spi_thread.join(timeout=2.0)
+            self._spi_thread = None
         if self.spi:
             try:
                 self.spi.close()
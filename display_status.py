@@ -5,11 +5,13 @@ Touch-enabled button panel for sending commands to OpenClaw.
 Uses raw spidev + RPi.GPIO instead of luma.lcd.
 """
 
+import bisect
 import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 try:
@@ -20,8 +22,9 @@ except ImportError:
     HARDWARE_AVAILABLE = False
 
 import config
+from fast_pack import pack_rgb565
 from spi_lock import spi_lock
-from ui.cyberpunk_theme import CyberpunkTheme, COLORS
+from ui.cyberpunk_theme import CyberpunkTheme, COLORS, load_font
 from ui.command_panel import CommandPanel, CommandButton
 
 
@@ -31,19 +34,19 @@ class DisplayNotification:
     type: str  # info, success, warning, error
     title: str
     message: str = ""
-    timestamp: datetime = None
+    timestamp: datetime = None  # For display only
     duration: float = 2.0  # seconds
-    expires_at: datetime = None
+    expires_at_mono: float = None  # time.monotonic() deadline
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
-        if self.expires_at is None:
-            self.expires_at = self.timestamp + timedelta(seconds=self.duration)
+        if self.expires_at_mono is None:
+            self.expires_at_mono = time.monotonic() + self.duration
 
     @property
     def is_expired(self) -> bool:
-        return datetime.now() > self.expires_at
+        return time.monotonic() > self.expires_at_mono
 
 
 class StatusDisplay:
@@ -80,14 +83,22 @@ class StatusDisplay:
         self.lock = threading.Lock()
         self.running = False
         self.fonts = {}
+
+        # Set by every state change so the render loop wakes immediately
+        self._dirty = threading.Event()
         self._load_fonts()
 
         # Cyberpunk UI components
         self.theme = CyberpunkTheme()
         self.command_panel = CommandPanel(theme=self.theme)
 
-        # Notification system (kept for compatibility)
+        # Notification system (kept for compatibility). Kept sorted by
+        # expiry, with a parallel list of expiry times for bisect.
         self._notifications: List[DisplayNotification] = []
+        self._notification_expiry: List[float] = []
+        # Source notifications already shown, by identity (the references
+        # keep their ids from being reused while they're tracked)
+        self._seen_source_notifications: dict = {}
         self._notification_lock = threading.Lock()
         self._max_notifications = config.NOTIFICATIONS.get("max_visible", 3)
 
@@ -98,22 +109,56 @@ class StatusDisplay:
         # Backlight state
         self._backlight_on = True
 
+        # Last RGB565 frame sent to the panel (for dirty-rectangle updates)
+        self._last_frame = None
+
+        # Two persistent RGB565 frame buffers, alternated so the previous
+        # frame stays intact for diffing while the next one is packed
+        self._frame_buffers = [
+            np.empty((config.SMALL_DISPLAY["height"], config.SMALL_DISPLAY["width"]), dtype=np.uint16)
+            for _ in range(2)
+        ]
+        self._frame_index = 0
+
+        # Window currently set on the panel, and the precomputed command
+        # sequence for the full-screen window
+        self._window = None
+        self._full_window = (0, 0, config.SMALL_DISPLAY["width"] - 1,
+                             config.SMALL_DISPLAY["height"] - 1)
+        self._full_window_seq = self._window_sequence(*self._full_window)
+
+        # Frame buffers reused by every render() instead of reallocated.
+        # The command panel repaints the whole content area each frame and
+        # the bezel border is never drawn on, so neither needs clearing.
+        width = config.SMALL_DISPLAY["width"]
+        height = config.SMALL_DISPLAY["height"]
+        bz = config.SMALL_BEZEL
+        self._frame = Image.new("RGB", (width, height), (0, 0, 0))
+        self._content_offset = (bz["left"], bz["top"])
+        if any(bz.values()):
+            self._content = Image.new("RGB", (width - bz["left"] - bz["right"],
+                                              height - bz["top"] - bz["bottom"]),
+                                      COLORS["background"])
+        else:
+            # No bezel: draw straight into the frame
+            self._content = self._frame
+
     def _load_fonts(self):
         """Load fonts for rendering."""
         try:
-            self.fonts["regular"] = ImageFont.truetype(
+            self.fonts["regular"] = load_font(
                 config.FONTS["default_path"],
                 config.FONTS["size_small"]
             )
-            self.fonts["medium"] = ImageFont.truetype(
+            self.fonts["medium"] = load_font(
                 config.FONTS["default_path"],
                 config.FONTS["size_medium"]
             )
-            self.fonts["bold"] = ImageFont.truetype(
+            self.fonts["bold"] = load_font(
                 config.FONTS["bold_path"],
                 config.FONTS["size_medium"]
             )
-            self.fonts["title"] = ImageFont.truetype(
+            self.fonts["title"] = load_font(
                 config.FONTS["bold_path"],
                 config.FONTS["size_large"]
             )
@@ -158,6 +203,8 @@ class StatusDisplay:
                 # Initialize display
                 self._reset()
                 self._init_display()
+                self._last_frame = None
+                self._window = None
 
                 # Turn on backlight AFTER display is initialized
                 GPIO.output(config.SMALL_DISPLAY["bl_pin"], GPIO.HIGH)
@@ -188,17 +235,18 @@ class StatusDisplay:
     def _command(self, cmd):
         """Send command byte to display."""
         GPIO.output(config.SMALL_DISPLAY["dc_pin"], GPIO.LOW)
-        self.spi.xfer([cmd])
+        self.spi.writebytes2([cmd])
 
     def _data(self, data):
         """Send data bytes to display."""
         GPIO.output(config.SMALL_DISPLAY["dc_pin"], GPIO.HIGH)
         if isinstance(data, int):
-            self.spi.xfer([data])
+            self.spi.writebytes2([data])
         else:
-            data = list(data) if isinstance(data, bytes) else data
-            for i in range(0, len(data), 4096):
-                self.spi.xfer(data[i:i + 4096])
+            # writebytes2 takes any buffer and splits it into spidev.bufsiz
+            # transfers in C, so the whole frame goes in one call. The GIL is
+            # released around each write(), so touch/LCD threads keep running
+            self.spi.writebytes2(data)
 
     def _init_display(self):
         """Initialize ILI9341 display with full power control sequence."""
@@ -220,7 +268,7 @@ class StatusDisplay:
         self._command(0xC7); self._data(0x86)  # VCOM control 2
 
         self._command(config.CMD_MADCTL)
-        self._data(0x40)  # MX=1, RGB
+        self._data(config.MADCTL_MX)  # MX=1, RGB (0x40)
         self._command(config.CMD_COLMOD)
         self._data(0x55)  # 16-bit color (RGB565)
 
@@ -242,16 +290,47 @@ class StatusDisplay:
         self._command(config.CMD_DISPON)
         time.sleep(0.1)
 
+    def _window_sequence(self, x0, y0, x1, y1):
+        """Build the CASET/PASET/RAMWR sequence for a drawing window."""
+        return [
+            (False, bytes((config.CMD_CASET,))),
+            (True, bytes((x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF))),
+            (False, bytes((config.CMD_PASET,))),
+            (True, bytes((y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF))),
+            (False, bytes((config.CMD_RAMWR,))),
+        ]
+
     def _set_window(self, x0, y0, x1, y1):
-        """Set the drawing window."""
-        self._command(config.CMD_CASET)
-        self._data([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
-        self._command(config.CMD_PASET)
-        self._data([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
-        self._command(config.CMD_RAMWR)
+        """
+        Set the drawing window and start a RAM write.
+
+        CASET/PASET are skipped when the window is already set; RAMWR is
+        always sent since it resets the write pointer to the window start.
+        """
+        window = (x0, y0, x1, y1)
+        if window == self._window:
+            self._command(config.CMD_RAMWR)
+            return
+
+        if window == self._full_window:
+            seq = self._full_window_seq
+        else:
+            seq = self._window_sequence(x0, y0, x1, y1)
+
+        dc_pin = config.SMALL_DISPLAY["dc_pin"]
+        for is_data, payload in seq:
+            GPIO.output(dc_pin, GPIO.HIGH if is_data else GPIO.LOW)
+            self.spi.writebytes2(payload)
+        self._window = window
 
     def _display_image(self, img):
-        """Display PIL image on the ILI9341 (RGB565 16-bit color)."""
+        """
+        Display PIL image on the ILI9341 (RGB565 16-bit color).
+
+        Frames are compared after RGB565 packing and only the bounding box
+        of changed pixels is sent; an identical frame skips the SPI transfer.
+        The frame becomes the diff reference only once it has been written.
+        """
         width = config.SMALL_DISPLAY["width"]
         height = config.SMALL_DISPLAY["height"]
 
@@ -260,19 +339,40 @@ class StatusDisplay:
         if img.mode != 'RGB':
             img = img.convert('RGB')
 
-        self._set_window(0, 0, width - 1, height - 1)
-        pixels = img.tobytes()
+        pixels = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(-1, 3)
 
-        # Convert to RGB565
-        data = bytearray(width * height * 2)
-        j = 0
-        for i in range(0, len(pixels), 3):
-            r, g, b = pixels[i], pixels[i+1], pixels[i+2]
-            pixel = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
-            data[j] = pixel >> 8
-            data[j+1] = pixel & 0xFF
-            j += 2
-        self._data(bytes(data))
+        # Pack straight into the panel's big-endian RGB565 byte order
+        frame = self._frame_buffers[self._frame_index]
+        pack_rgb565(pixels, frame.view(np.uint8).reshape(-1, 2))
+
+        if self._last_frame is None:
+            x0, y0, x1, y1 = 0, 0, width - 1, height - 1
+        else:
+            changed = frame != self._last_frame
+            rows = np.flatnonzero(changed.any(axis=1))
+            if not rows.size:
+                return
+            cols = np.flatnonzero(changed.any(axis=0))
+            x0, y0, x1, y1 = int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])
+
+        # A full frame goes out straight from the buffer; a sub-rectangle is
+        # gathered into one contiguous block first
+        try:
+            self._set_window(x0, y0, x1, y1)
+            self._data(np.ascontiguousarray(frame[y0:y1 + 1, x0:x1 + 1]))
+        except Exception:
+            # The panel may hold a partial frame; resend everything next time
+            self.force_full_refresh()
+            raise
+
+        # Only now does the panel hold this frame
+        self._last_frame = frame
+        self._frame_index ^= 1
+
+    def force_full_refresh(self):
+        """Resend the whole frame on the next render."""
+        self._last_frame = None
+        self._window = None
 
     # === Status Update Methods ===
 
@@ -280,8 +380,9 @@ class StatusDisplay:
         """Update status data."""
         with self.lock:
             for key, value in kwargs.items():
-                if key in self.status_data:
+                if key in self.status_data and self.status_data[key] != value:
                     self.status_data[key] = value
+                    self._dirty.set()
 
     # === Command Panel Methods ===
 
@@ -309,14 +410,17 @@ class StatusDisplay:
             state: New state (normal, pressed, running, success, error)
         """
         self.command_panel.set_button_state(button_id, state)
+        self._dirty.set()
 
     def reset_button(self, button_id: str):
         """Reset a button to normal state."""
         self.command_panel.set_button_state(button_id, "normal")
+        self._dirty.set()
 
     def reset_all_buttons(self):
         """Reset all buttons to normal state."""
         self.command_panel.reset_all_buttons()
+        self._dirty.set()
 
     def get_button_command(self, button_id: str) -> Optional[str]:
         """Get the command string for a button."""
@@ -341,21 +445,33 @@ class StatusDisplay:
         )
 
         with self._notification_lock:
-            self._notifications.append(notification)
-            if len(self._notifications) > self._max_notifications * 2:
-                self._notifications = self._notifications[-self._max_notifications * 2:]
+            i = bisect.bisect_right(self._notification_expiry, notification.expires_at_mono)
+            self._notification_expiry.insert(i, notification.expires_at_mono)
+            self._notifications.insert(i, notification)
+            excess = len(self._notifications) - self._max_notifications * 2
+            if excess > 0:
+                # Drop the ones closest to expiring
+                del self._notification_expiry[:excess]
+                del self._notifications[:excess]
+        self._dirty.set()
 
     def clear_notifications(self):
         """Clear all notifications."""
         with self._notification_lock:
             self._notifications = []
+            self._notification_expiry = []
+        self._dirty.set()
 
     def _get_active_notifications(self) -> List[DisplayNotification]:
         """Get non-expired notifications."""
+        now = time.monotonic()
         with self._notification_lock:
-            active = [n for n in self._notifications if not n.is_expired]
-            self._notifications = active
-            return active[:self._max_notifications]
+            # Expired entries are all at the front
+            expired = bisect.bisect_left(self._notification_expiry, now)
+            if expired:
+                del self._notification_expiry[:expired]
+                del self._notifications[:expired]
+            return self._notifications[:self._max_notifications]
 
     # === View Cycling (kept for compatibility) ===
 
@@ -368,17 +484,10 @@ class StatusDisplay:
 
     def render(self):
         """Render the cyberpunk command panel."""
-        width = config.SMALL_DISPLAY["width"]
-        height = config.SMALL_DISPLAY["height"]
-        bz = config.SMALL_BEZEL
-
-        # Full-size black canvas (matches bezel)
-        image = Image.new("RGB", (width, height), (0, 0, 0))
-
-        # Content area inset by per-side borders
-        cw = width - bz["left"] - bz["right"]
-        ch = height - bz["top"] - bz["bottom"]
-        content = Image.new("RGB", (cw, ch), COLORS["background"])
+        # Full-size black canvas (matches bezel) and the content area inset
+        # by per-side borders, both reused between frames
+        image = self._frame
+        content = self._content
 
         # Get current status
         with self.lock:
@@ -393,7 +502,8 @@ class StatusDisplay:
         self.command_panel.apply_scanlines(content, spacing=2, opacity=15)
 
         # Paste content onto black canvas
-        image.paste(content, (bz["left"], bz["top"]))
+        if content is not image:
+            image.paste(content, self._content_offset)
 
         # Display (use lock to prevent SPI bus contention)
         if self.spi:
@@ -420,18 +530,29 @@ class StatusDisplay:
                 # Get notifications if callback provided (kept for compatibility)
                 if get_notifications_func:
                     notifications = get_notifications_func()
+                    # The source returns everything from the last few seconds;
+                    # only take objects not seen on a previous pass. Identity,
+                    # not timestamps, so a clock step can't drop or repeat one.
+                    seen = self._seen_source_notifications
+                    current = {}
                     for notif in notifications:
-                        existing_times = [n.timestamp for n in self._notifications]
-                        if notif.timestamp not in existing_times:
+                        current[id(notif)] = notif
+                        if id(notif) not in seen:
                             self.add_notification(
                                 notif.type,
                                 notif.title,
                                 notif.message,
                                 notif.duration
                             )
+                    self._seen_source_notifications = current
 
+                # Changes made from here on (including during render) wake
+                # the next wait immediately
+                self._dirty.clear()
                 self.render()
-                time.sleep(interval)
+
+                # Sleep until a state change or the refresh deadline
+                self._dirty.wait(interval)
 
             except Exception as e:
                 print(f"[Display2] Render error: {e}")
@@ -444,6 +565,7 @@ class StatusDisplay:
     def stop(self):
         """Stop the render loop."""
         self.running = False
+        self._dirty.set()
 
     def set_backlight(self, on: bool):
         """Control backlight."""
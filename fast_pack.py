@@ -0,0 +1,43 @@
+"""
+RGB888 to RGB565 packing for the ILI9341.
+
+pack_rgb565() writes big-endian RGB565 (RRRRRGGG GGGBBBBB) into a
+caller-owned buffer. When numba is installed the loop is JIT-compiled
+(first call compiles, later calls reuse the on-disk cache); otherwise
+NumPy vectorized shifts are used.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _pack_rgb565_numpy(rgb, out):
+    """
+    Pack with NumPy array operations.
+
+    Args:
+        rgb: (N, 3) uint8 array of RGB pixels
+        out: (N, 2) uint8 array receiving the two bytes of each pixel
+    """
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    out[:, 0] = (r & 0xF8) | (g >> 5)
+    out[:, 1] = ((g << 3) & 0xE0) | (b >> 3)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _pack_rgb565_numba(rgb, out):
+        """Pack with a compiled per-pixel loop (same arguments as the NumPy path)."""
+        for i in prange(rgb.shape[0]):
+            r = rgb[i, 0]
+            g = rgb[i, 1]
+            b = rgb[i, 2]
+            out[i, 0] = (r & 0xF8) | (g >> 5)
+            out[i, 1] = ((g << 3) & 0xE0) | (b >> 3)
+
+    pack_rgb565 = _pack_rgb565_numba
+else:
+    pack_rgb565 = _pack_rgb565_numpy
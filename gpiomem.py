@@ -0,0 +1,62 @@
+"""
+Direct GPIO output through /dev/gpiomem.
+
+Setting a pin is a single store to the GPSET0/GPCLR0 register instead of a
+round trip through RPi.GPIO. Pins still need to be configured as outputs
+with GPIO.setup() first - this only drives the level.
+
+Only BCM2835/6/7 and BCM2711 (Pi 1-4) use this register layout; on other
+SoCs OutputPin raises OSError so callers can fall back to RPi.GPIO.
+"""
+
+import mmap
+import os
+
+GPIOMEM_PATH = "/dev/gpiomem"
+GPSET0 = 0x1C  # Write 1 to set pin high
+GPCLR0 = 0x28  # Write 1 to set pin low
+
+SUPPORTED_SOCS = (b"brcm,bcm2835", b"brcm,bcm2836", b"brcm,bcm2837", b"brcm,bcm2711")
+
+_regs = None
+
+
+def _map_registers():
+    """Map the GPIO register block (shared by all pins)."""
+    global _regs
+    if _regs is None:
+        try:
+            with open("/proc/device-tree/compatible", "rb") as f:
+                compatible = f.read()
+        except OSError:
+            compatible = b""
+        if not any(soc in compatible for soc in SUPPORTED_SOCS):
+            raise OSError("GPIO register layout not supported on this SoC")
+
+        fd = os.open(GPIOMEM_PATH, os.O_RDWR | os.O_SYNC)
+        try:
+            _regs = mmap.mmap(fd, 4096, mmap.MAP_SHARED,
+                              mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+    return _regs
+
+
+class OutputPin:
+    """Fast level setter for a single output pin (BCM numbering, 0-31)."""
+
+    def __init__(self, pin):
+        if not 0 <= pin < 32:
+            raise ValueError(f"Pin {pin} is not in GPIO bank 0")
+        self.pin = pin
+        # 32-bit view so each write is one word-sized store to the register
+        self._words = memoryview(_map_registers()).cast("I")
+        self._mask = 1 << pin
+
+    def high(self):
+        """Drive the pin high."""
+        self._words[GPSET0 // 4] = self._mask
+
+    def low(self):
+        """Drive the pin low."""
+        self._words[GPCLR0 // 4] = self._mask
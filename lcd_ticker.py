@@ -38,11 +38,20 @@ class LCDTicker:
         self._state_text = "IDLE"
         self._detail_text = ""
         self._scroll_position = 0
+        self._scroll_text = ""  # Padded detail text, doubled (see _set_scroll_text)
+        self._scroll_len = 0
 
         # Mode flash state
         self._flash_mode = None
         self._flash_until = 0
 
+        # What is currently on the LCD, per row (None = unknown)
+        self._lcd_lines = [None] * self.rows
+
+        # Set when content changes so the ticker redraws without waiting
+        # for the next scroll step
+        self._changed = threading.Event()
+
         self._initialized = False
 
     def initialize(self):
@@ -71,6 +80,7 @@ class LCDTicker:
 
             # Clear and show initial state
             self.lcd.clear()
+            self._lcd_lines = [" " * self.cols] * self.rows
             self._update_display()
 
             self._initialized = True
@@ -91,6 +101,7 @@ class LCDTicker:
         with self.lock:
             self._state_text = line1[:self.cols]
             self._detail_text = line2[:self.cols] if len(line2) <= self.cols else line2
+            self._set_scroll_text()
             self._scroll_position = 0
 
         if self._initialized and not self.demo_mode:
@@ -102,8 +113,11 @@ class LCDTicker:
         Args:
             state_text: State text to display
         """
+        state_text = state_text[:self.cols]
         with self.lock:
-            self._state_text = state_text[:self.cols]
+            if state_text != self._state_text:
+                self._state_text = state_text
+                self._changed.set()
 
     def set_detail(self, detail_text):
         """Set scrolling text for line 2.
@@ -112,9 +126,29 @@ class LCDTicker:
             detail_text: Detail text (will scroll if > 16 chars)
         """
         with self.lock:
-            self._detail_text = detail_text
+            if detail_text != self._detail_text:
+                self._detail_text = detail_text
+                self._set_scroll_text()
+                self._changed.set()
             self._scroll_position = 0
 
+    def _set_scroll_text(self):
+        """Precompute the scroll buffer for the current detail text.
+
+        The padded text is stored twice so every scroll window is a single
+        slice instead of a rebuilt rotation. Call with self.lock held.
+        """
+        padded = self._detail_text + "   "  # Add padding
+        self._scroll_text = padded * 2
+        self._scroll_len = len(padded)
+
+    def _detail_line(self):
+        """Return line 2 for the current scroll position (lock held)."""
+        if len(self._detail_text) <= self.cols:
+            return self._detail_text.ljust(self.cols)
+        start = self._scroll_position % self._scroll_len
+        return self._scroll_text[start:start + self.cols]
+
     def show_mode_briefly(self, mode_name, duration=1.5):
         """Flash a mode name on the display.
 
@@ -125,6 +159,7 @@ class LCDTicker:
         with self.lock:
             self._flash_mode = mode_name[:self.cols]
             self._flash_until = time.time() + duration
+        self._changed.set()
 
     def _update_display(self):
         """Update the physical LCD display."""
@@ -140,25 +175,47 @@ class LCDTicker:
                 else:
                     self._flash_mode = None
                     line1 = self._state_text.ljust(self.cols)
-
-                    # Handle scrolling for line 2
-                    if len(self._detail_text) <= self.cols:
-                        line2 = self._detail_text.ljust(self.cols)
-                    else:
-                        # Scroll the text
-                        scroll_text = self._detail_text + "   "  # Add padding
-                        start = self._scroll_position % len(scroll_text)
-                        line2 = (scroll_text[start:] + scroll_text[:start])[:self.cols]
+                    line2 = self._detail_line()
 
             # Write to LCD
-            self.lcd.cursor_pos = (0, 0)
-            self.lcd.write_string(line1)
-            self.lcd.cursor_pos = (1, 0)
-            self.lcd.write_string(line2)
+            self._write_line(0, line1)
+            self._write_line(1, line2)
 
         except Exception as e:
+            # Contents are unknown after a failed write; redraw everything next time
+            self._lcd_lines = [None] * self.rows
             print(f"[LCD] Update error: {e}")
 
+    def _write_line(self, row, text):
+        """Write only the characters of a line that differ from the LCD.
+
+        Every character is a separate I2C transaction through the PCF8574,
+        so unchanged lines cost nothing and a scroll step rewrites only the
+        runs that actually moved.
+        """
+        prev = self._lcd_lines[row]
+        if text == prev:
+            return
+
+        if prev is None or len(prev) != len(text):
+            self.lcd.cursor_pos = (row, 0)
+            self.lcd.write_string(text)
+        else:
+            col = 0
+            n = len(text)
+            while col < n:
+                if text[col] == prev[col]:
+                    col += 1
+                    continue
+                end = col + 1
+                while end < n and text[end] != prev[end]:
+                    end += 1
+                self.lcd.cursor_pos = (row, col)
+                self.lcd.write_string(text[col:end])
+                col = end
+
+        self._lcd_lines[row] = text
+
     def _demo_print(self):
         """Print LCD state to console in demo mode."""
         with self.lock:
@@ -167,12 +224,7 @@ class LCDTicker:
                 line2 = "MODE CHANGED".center(self.cols)
             else:
                 line1 = self._state_text.ljust(self.cols)
-                if len(self._detail_text) <= self.cols:
-                    line2 = self._detail_text.ljust(self.cols)
-                else:
-                    scroll_text = self._detail_text + "   "
-                    start = self._scroll_position % len(scroll_text)
-                    line2 = (scroll_text[start:] + scroll_text[:start])[:self.cols]
+                line2 = self._detail_line()
 
         print(f"[LCD] +{'-' * self.cols}+")
         print(f"[LCD] |{line1}|")
@@ -188,6 +240,10 @@ class LCDTicker:
         last_demo_print = 0
 
         while self.running:
+            # Sleep until the next scroll step or a content change
+            timeout = self.scroll_delay - (time.time() - last_scroll_time)
+            self._changed.wait(max(0.0, timeout))
+            self._changed.clear()
             current_time = time.time()
 
             # Update scroll position
@@ -198,23 +254,22 @@ class LCDTicker:
 
                 last_scroll_time = current_time
 
-                # Update display
-                if self._initialized:
-                    if self.demo_mode:
-                        # In demo mode, only print occasionally
-                        if current_time - last_demo_print >= 2.0:
-                            self._demo_print()
-                            last_demo_print = current_time
-                    else:
-                        self._update_display()
-
-            time.sleep(0.05)  # Small sleep to prevent busy-waiting
+            # Update display
+            if self._initialized:
+                if self.demo_mode:
+                    # In demo mode, only print occasionally
+                    if current_time - last_demo_print >= 2.0:
+                        self._demo_print()
+                        last_demo_print = current_time
+                else:
+                    self._update_display()
 
         print("[LCD] LCD ticker stopped")
 
     def stop(self):
         """Stop the LCD ticker."""
         self.running = False
+        self._changed.set()
 
     def cleanup(self):
         """Clean up resources."""
@@ -223,6 +278,7 @@ class LCDTicker:
         if self.lcd and not self.demo_mode:
             try:
                 self.lcd.clear()
+                self._lcd_lines = [None] * self.rows
                 self.lcd.backlight_enabled = False
                 self.lcd.close()
             except Exception as e:
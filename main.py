@@ -10,11 +10,16 @@ Uses raw spidev + RPi.GPIO instead of luma.lcd + lgpio.
 """
 
 import argparse
+import itertools
+import logging
+import os
+import re
+import sched
+import select
 import signal
 import sys
 import threading
 import time
-import random
 
 try:
     import RPi.GPIO as GPIO
@@ -33,13 +38,41 @@ from websocket_client import ConnectionState
 from ui.molty import MoltyState
 import config
 
+# Notification message keyword -> (activity type, status, Molty state,
+# seconds before returning to IDLE or None to stay). Listed in priority
+# order: when several keywords appear, the earliest entry here wins.
+_NOTIFICATION_CLASSES = {
+    "Starting": ("tool", "running", MoltyState.WORKING, None),
+    "Completed": ("status", "done", MoltyState.SUCCESS, 2.0),
+    "Success": ("status", "done", MoltyState.SUCCESS, 2.0),
+    "Failed": ("error", "fail", MoltyState.ERROR, 3.0),
+    "Error": ("error", "fail", MoltyState.ERROR, 3.0),
+}
+_NOTIFICATION_RANK = {keyword: i for i, keyword in enumerate(_NOTIFICATION_CLASSES)}
+_NOTIFICATION_RE = re.compile("|".join(_NOTIFICATION_CLASSES))
+
+# Per-event diagnostics (taps, rotation, connection changes). Debug lines are
+# skipped without formatting unless OPENCLAW_LOG=DEBUG.
+log = logging.getLogger("Main")
+
 
 class DisplayCommandCenter:
     """Main application coordinator for the Cyberpunk Mission Control UI."""
 
+    # Molty state to LCD line 1 text
+    _LCD_STATE_MAP = {
+        MoltyState.IDLE: "IDLE",
+        MoltyState.WORKING: "WORKING",
+        MoltyState.SUCCESS: "DONE!",
+        MoltyState.ERROR: "ERROR!",
+        MoltyState.THINKING: "THINKING...",
+        MoltyState.LISTENING: "LISTENING",
+    }
+
     def __init__(self, demo_mode=False, openclaw_config=None):
         self.demo_mode = demo_mode
         self.running = False
+        self._stop_event = threading.Event()
         self.openclaw_config = openclaw_config or OpenClawConfig.load()
 
         # Components
@@ -56,17 +89,28 @@ class DisplayCommandCenter:
         # Connection state tracking
         self._was_connected = False
 
+        # Delayed actions (Molty back to IDLE, button resets, command
+        # timeouts) all run on one scheduler thread instead of a Timer each
+        self._scheduler_wakeup = threading.Event()
+        self._scheduler = sched.scheduler(time.monotonic, self._scheduler_delay)
+
         # State timers (for auto-returning Molty to IDLE)
-        self._molty_state_timer = None
+        self._molty_state_event = None
         self._active_button_id = None
+        self._command_timeout_event = None  # Only one command is active at a time
 
         # Demo mode mock actions
         self._demo_action_index = 0
 
         # Display mode and scroll state
-        self._display_mode = "activity"  # activity | molty | stats
+        self._mode_cycle = itertools.cycle(["activity", "molty", "stats"])
+        self._display_mode = next(self._mode_cycle)
+        # Only written from rotary callbacks (one thread), so no lock
         self._feed_scroll_offset = 0
-        self._scroll_lock = threading.Lock()
+
+        # Pipe that stop() writes to so the demo input loop can block on
+        # stdin without a polling timeout
+        self._wake_r, self._wake_w = os.pipe() if demo_mode else (None, None)
 
     def _setup_bridge_callbacks(self):
         """Configure bridge event handlers."""
@@ -77,18 +121,18 @@ class DisplayCommandCenter:
             activity_type = "tool"
             status = "done"
 
-            if "Starting" in notification.message or notification.title.startswith("Tool:"):
-                activity_type = "tool"
-                status = "running"
-                self.display1.set_molty_state(MoltyState.WORKING)
-            elif "Completed" in notification.message or "Success" in notification.message:
-                activity_type = "status"
-                status = "done"
-                self._set_molty_state_with_timer(MoltyState.SUCCESS, 2.0)
-            elif "Failed" in notification.message or "Error" in notification.message:
-                activity_type = "error"
-                status = "fail"
-                self._set_molty_state_with_timer(MoltyState.ERROR, 3.0)
+            # One scan of the message for every keyword
+            keywords = _NOTIFICATION_RE.findall(notification.message)
+            if notification.title.startswith("Tool:"):
+                keywords.append("Starting")
+
+            if keywords:
+                keyword = min(keywords, key=_NOTIFICATION_RANK.__getitem__)
+                activity_type, status, molty_state, delay = _NOTIFICATION_CLASSES[keyword]
+                if delay is None:
+                    self.display1.set_molty_state(molty_state)
+                else:
+                    self._set_molty_state_with_timer(molty_state, delay)
             elif notification.type == "info":
                 activity_type = "notification"
 
@@ -101,6 +145,9 @@ class DisplayCommandCenter:
 
             # Update button state if there's an active button
             if self._active_button_id:
+                if status in ("done", "fail"):
+                    # A response arrived - the command can't time out now
+                    self._cancel_command_timeout()
                 if status == "done":
                     self.display2.set_button_state(self._active_button_id, "success")
                     self._reset_button_after_delay(self._active_button_id, 1.0)
@@ -112,20 +159,20 @@ class DisplayCommandCenter:
             """Handle connection state changes."""
             if state == ConnectionState.CONNECTED:
                 if not self._was_connected:
-                    print("[Main] Connected to OpenClaw")
+                    log.info("Connected to OpenClaw")
                     self.display1.add_activity("status", "Connected", "OpenClaw online")
                     self.display1.set_molty_state(MoltyState.IDLE)
                     self.display1.set_status_text("Connected. Tap a command to begin.")
                 self._was_connected = True
             elif state == ConnectionState.DISCONNECTED:
                 if self._was_connected:
-                    print("[Main] Disconnected from OpenClaw")
+                    log.info("Disconnected from OpenClaw")
                     self.display1.add_activity("error", "Disconnected", "Connection lost")
                     self.display1.set_molty_state(MoltyState.ERROR)
                     self.display1.set_status_text("Disconnected. Tap to reconnect.")
                 self._was_connected = False
             elif state == ConnectionState.RECONNECTING:
-                print("[Main] Reconnecting to OpenClaw...")
+                log.info("Reconnecting to OpenClaw...")
                 self.display1.add_activity("notification", "Reconnecting...", "")
                 self.display1.set_molty_state(MoltyState.THINKING)
 
@@ -155,17 +202,15 @@ class DisplayCommandCenter:
         self.display1.set_molty_state(state)
 
         # Cancel existing timer
-        if self._molty_state_timer:
-            self._molty_state_timer.cancel()
+        if self._molty_state_event:
+            self._cancel_scheduled(self._molty_state_event)
 
         # Schedule return to IDLE
         def return_to_idle():
             if self.display1.get_molty_state() == state:
                 self.display1.set_molty_state(MoltyState.IDLE)
 
-        self._molty_state_timer = threading.Timer(delay_seconds, return_to_idle)
-        self._molty_state_timer.daemon = True
-        self._molty_state_timer.start()
+        self._molty_state_event = self._schedule(delay_seconds, return_to_idle)
 
     def _reset_button_after_delay(self, button_id, delay_seconds):
         """Reset button to normal state after delay."""
@@ -174,22 +219,68 @@ class DisplayCommandCenter:
             if self._active_button_id == button_id:
                 self._active_button_id = None
 
-        timer = threading.Timer(delay_seconds, reset)
-        timer.daemon = True
-        timer.start()
+        self._schedule(delay_seconds, reset)
+
+    def _schedule(self, delay_seconds, action):
+        """Run action on the scheduler thread after a delay.
+
+        Returns:
+            Event handle for _cancel_scheduled()
+        """
+        event = self._scheduler.enter(delay_seconds, 1, action)
+        # Wake the scheduler in case this is now the earliest event
+        self._scheduler_wakeup.set()
+        return event
+
+    def _cancel_scheduled(self, event):
+        """Cancel a scheduled action (no-op if it already ran)."""
+        try:
+            self._scheduler.cancel(event)
+        except ValueError:
+            pass
+
+    def _cancel_command_timeout(self):
+        """Cancel the pending command timeout, if any."""
+        if self._command_timeout_event:
+            self._cancel_scheduled(self._command_timeout_event)
+            self._command_timeout_event = None
+
+    def _scheduler_delay(self, timeout):
+        """Sleep until the next event is due or the queue changes."""
+        self._scheduler_wakeup.wait(timeout)
+        self._scheduler_wakeup.clear()
+
+    def _run_scheduler(self):
+        """Thread function running delayed actions."""
+        while self.running:
+            try:
+                self._scheduler.run()
+            except Exception as e:
+                log.error("Scheduled action error: %s", e)
+                continue
+            # stop() empties the queue and its wakeup may already have been
+            # consumed by _scheduler_delay, so check before sleeping again
+            if not self.running:
+                break
+            # Queue is empty - sleep until something is scheduled
+            self._scheduler_wakeup.wait()
+            self._scheduler_wakeup.clear()
 
     def _setup_touch_callbacks(self):
         """Configure touch event handlers for button panel."""
+        # Status bar band on the small display (35px below the top bezel)
+        status_bar_top = config.SMALL_BEZEL["top"]
+        status_bar_bottom = status_bar_top + 35
 
         def on_tap(x, y):
             """Handle tap events - check for button hits."""
-            print(f"[Main] Tap at ({x}, {y})")
+            log.debug("Tap at (%d, %d)", x, y)
 
             # Find which button was tapped
             button = self.display2.find_button(x, y)
 
             if button:
-                print(f"[Main] Button tapped: {button.id} - {button.label}")
+                log.debug("Button tapped: %s - %s", button.id, button.label)
 
                 # Visual feedback
                 self.display2.set_button_state(button.id, "pressed")
@@ -216,16 +307,16 @@ class DisplayCommandCenter:
                     active_btn = button.id
                     def command_timeout():
                         if self._active_button_id == active_btn:
-                            print(f"[Main] Command timeout for {active_btn}")
+                            log.info("Command timeout for %s", active_btn)
                             self.display1.set_molty_state(MoltyState.IDLE)
                             self.display1.set_status_text("No response received.")
                             self.display1.update_latest_activity_status("done")
                             self.display2.reset_button(active_btn)
                             self._active_button_id = None
 
-                    timer = threading.Timer(15.0, command_timeout)
-                    timer.daemon = True
-                    timer.start()
+                    # Replaces the previous command's timeout, if still pending
+                    self._cancel_command_timeout()
+                    self._command_timeout_event = self._schedule(15.0, command_timeout)
 
                 else:
                     # Not connected - show error
@@ -241,29 +332,28 @@ class DisplayCommandCenter:
 
             else:
                 # Tap outside buttons - could be status bar area
-                bz_top = config.SMALL_BEZEL["top"]
-                if bz_top <= y < bz_top + 35:
+                if status_bar_top <= y < status_bar_bottom:
                     # Tapped status bar - try to reconnect if disconnected
                     if not self.bridge.is_connected():
-                        print("[Main] Status bar tap - forcing reconnect")
+                        log.info("Status bar tap - forcing reconnect")
                         self.bridge.force_reconnect()
                         self.display1.add_activity("notification", "Reconnecting...", "")
                         self.display1.set_molty_state(MoltyState.THINKING)
 
         def on_long_press(x, y):
             """Handle long press - force reconnect or cancel."""
-            print(f"[Main] Long press at ({x}, {y})")
+            log.debug("Long press at (%d, %d)", x, y)
 
-            bz_top = config.SMALL_BEZEL["top"]
-            if bz_top <= y < bz_top + 35:
+            if status_bar_top <= y < status_bar_bottom:
                 # Long press on status bar - force reconnect
-                print("[Main] Long press status bar - forcing reconnect")
+                log.info("Long press status bar - forcing reconnect")
                 self.bridge.force_reconnect()
             else:
                 # Long press on button area - cancel current operation
                 if self.bridge.is_connected() and self._active_button_id:
-                    print("[Main] Long press - cancelling current task")
+                    log.info("Long press - cancelling current task")
                     self.bridge.cancel_current()
+                    self._cancel_command_timeout()
                     self.display2.reset_all_buttons()
                     self._active_button_id = None
                     self.display1.add_activity("notification", "Cancelled", "Operation cancelled")
@@ -271,7 +361,7 @@ class DisplayCommandCenter:
                 else:
                     # Toggle backlight when nothing is running
                     is_on = self.display2.toggle_backlight()
-                    print(f"[Main] Backlight {'on' if is_on else 'off'}")
+                    log.debug("Backlight %s", "on" if is_on else "off")
 
         # Both top and bottom now use the same handler (button detection)
         self.touch.on_tap_top = on_tap
@@ -283,32 +373,29 @@ class DisplayCommandCenter:
 
         def on_rotate_cw():
             """Handle clockwise rotation - scroll up (show newer)."""
-            with self._scroll_lock:
-                self._feed_scroll_offset = max(0, self._feed_scroll_offset - 1)
-                self.display1.set_scroll_offset(self._feed_scroll_offset)
-            print(f"[Main] Rotary CW - scroll offset: {self._feed_scroll_offset}")
+            offset = max(0, self._feed_scroll_offset - 1)
+            self._feed_scroll_offset = offset
+            self.display1.set_scroll_offset(offset)
+            log.debug("Rotary CW - scroll offset: %d", offset)
 
         def on_rotate_ccw():
             """Handle counter-clockwise rotation - scroll down (show older)."""
-            with self._scroll_lock:
-                self._feed_scroll_offset += 1
-                self.display1.set_scroll_offset(self._feed_scroll_offset)
-            print(f"[Main] Rotary CCW - scroll offset: {self._feed_scroll_offset}")
+            offset = self._feed_scroll_offset + 1
+            self._feed_scroll_offset = offset
+            self.display1.set_scroll_offset(offset)
+            log.debug("Rotary CCW - scroll offset: %d", offset)
 
         def on_button_press():
             """Handle button press - cycle display mode."""
-            modes = ["activity", "molty", "stats"]
-            idx = (modes.index(self._display_mode) + 1) % len(modes)
-            self._display_mode = modes[idx]
-            print(f"[Main] Mode changed to: {self._display_mode}")
+            self._display_mode = next(self._mode_cycle)
+            log.debug("Mode changed to: %s", self._display_mode)
 
             # Flash mode name on LCD
             self.lcd.show_mode_briefly(self._display_mode.upper())
 
             # Reset scroll when changing modes
-            with self._scroll_lock:
-                self._feed_scroll_offset = 0
-                self.display1.set_scroll_offset(0)
+            self._feed_scroll_offset = 0
+            self.display1.set_scroll_offset(0)
 
         self.rotary.on_rotate_cw = on_rotate_cw
         self.rotary.on_rotate_ccw = on_rotate_ccw
@@ -316,31 +403,43 @@ class DisplayCommandCenter:
 
     def _run_lcd(self):
         """Thread function for LCD state synchronization."""
+        # Resolve everything the loop touches once
+        feed = getattr(self.display1, 'activity_feed', None)
+        get_molty_state = self.display1.get_molty_state
+        set_state = self.lcd.set_state
+        set_detail = self.lcd.set_detail
+        wait = self._stop_event.wait
+        update_interval = config.CHARACTER_LCD["update_interval"]
+        last_state = None
+        last_entry = None  # Feed entry the current detail was built from
+        last_detail = None
+
         while self.running:
             try:
                 # Get current Molty state and map to LCD text
-                molty_state = self.display1.get_molty_state()
-                state_map = {
-                    MoltyState.IDLE: "IDLE",
-                    MoltyState.WORKING: "WORKING",
-                    MoltyState.SUCCESS: "DONE!",
-                    MoltyState.ERROR: "ERROR!",
-                    MoltyState.THINKING: "THINKING...",
-                    MoltyState.LISTENING: "LISTENING",
-                }
-                state_text = state_map.get(molty_state, "UNKNOWN")
-                self.lcd.set_state(state_text)
-
-                # Get latest activity detail for scrolling line
-                if hasattr(self.display1, 'activity_feed') and self.display1.activity_feed.entries:
-                    latest = self.display1.activity_feed.entries[-1]
-                    detail = f"{latest.title}: {latest.detail}" if latest.detail else latest.title
-                    self.lcd.set_detail(detail)
+                molty_state = get_molty_state()
+                state_text = self._LCD_STATE_MAP.get(molty_state, "UNKNOWN")
+                if state_text != last_state:
+                    set_state(state_text)
+                    last_state = state_text
+
+                # Get latest activity detail for scrolling line. Only push it
+                # on change - set_detail() restarts the scroll from the left.
+                if feed is not None and feed.entries:
+                    latest = feed.entries[-1]
+                    # Title/detail of an entry never change, so only a new
+                    # entry needs its line rebuilt
+                    if latest is not last_entry:
+                        last_entry = latest
+                        detail = f"{latest.title}: {latest.detail}" if latest.detail else latest.title
+                        if detail != last_detail:
+                            set_detail(detail)
+                            last_detail = detail
 
             except Exception as e:
-                print(f"[Main] LCD sync error: {e}")
+                log.error("LCD sync error: %s", e)
 
-            time.sleep(config.CHARACTER_LCD["update_interval"])
+            wait(update_interval)
 
     def initialize(self):
         """Initialize all components."""
@@ -450,6 +549,11 @@ class DisplayCommandCenter:
         """Thread function for touch handler."""
         self.touch.run(poll_interval=0.005)
 
+    def _run_touch_events(self):
+        """Thread function running touch callbacks queued by the touch poller."""
+        while self.running:
+            self.touch.process_events()
+
     def _demo_touch_simulation(self):
         """Simulate touch events and mock actions in demo mode."""
         print("[Main] Demo touch simulation active")
@@ -475,27 +579,38 @@ class DisplayCommandCenter:
             ("tool", "Git push", "Pushed 3 commits to main"),
         ]
 
+        n_actions = len(mock_actions)
+        buttons = self.display2.command_panel.buttons
+
         molty_states = list(MoltyState)
         molty_state_index = 0
 
+        watched = [sys.stdin, self._wake_r]
         while self.running:
             try:
-                import select
-                if select.select([sys.stdin], [], [], 0.5)[0]:
-                    user_input = sys.stdin.readline().strip().lower()
+                ready = select.select(watched, [], [])[0]
+                if self._wake_r in ready:
+                    # Woken by stop()
+                    os.read(self._wake_r, 64)
+                if sys.stdin in ready:
+                    line = sys.stdin.readline()
+                    if not line:
+                        # stdin closed (no terminal) - only wait for stop()
+                        watched = [self._wake_r]
+                        continue
+                    user_input = line.strip().lower()
 
                     if user_input == 'q':
                         print("[Main] Quit requested")
-                        self.stop()
+                        # Wake the main thread, which runs stop()
+                        self._stop_event.set()
                         break
 
                     elif user_input in ('', ' '):
-                        # Simulate random button tap
-                        buttons = self.display2.command_panel.buttons
-                        button = random.choice(buttons)
+                        # Simulate a tap on the button panel
                         self.touch.simulate_touch("bottom")
                         # Add mock activity
-                        action = mock_actions[self._demo_action_index % len(mock_actions)]
+                        action = mock_actions[self._demo_action_index % n_actions]
                         self.display1.add_activity(action[0], action[1], action[2], "running")
                         self.display1.set_molty_state(MoltyState.WORKING)
                         self._demo_action_index += 1
@@ -505,14 +620,11 @@ class DisplayCommandCenter:
                             self.display1.update_latest_activity_status("done")
                             self._set_molty_state_with_timer(MoltyState.SUCCESS, 2.0)
 
-                        timer = threading.Timer(1.5, complete_action)
-                        timer.daemon = True
-                        timer.start()
+                        self._schedule(1.5, complete_action)
 
                     elif user_input in '123456':
                         # Tap specific button
                         idx = int(user_input) - 1
-                        buttons = self.display2.command_panel.buttons
                         if idx < len(buttons):
                             button = buttons[idx]
                             x = button.x + button.width // 2
@@ -528,7 +640,7 @@ class DisplayCommandCenter:
 
                     elif user_input == 'a':
                         # Add mock activity
-                        action = mock_actions[self._demo_action_index % len(mock_actions)]
+                        action = mock_actions[self._demo_action_index % n_actions]
                         self.display1.add_activity(action[0], action[1], action[2])
                         self._demo_action_index += 1
                         print(f"[Main] Added activity: {action[1]}")
@@ -552,66 +664,49 @@ class DisplayCommandCenter:
     def run(self):
         """Start all components in threads."""
         self.running = True
-
-        # Start display threads
-        display1_thread = threading.Thread(target=self._run_display1, name="Display1")
-        display1_thread.daemon = True
-        display1_thread.start()
-        self.threads.append(display1_thread)
-        print("[Main] Display 1 thread started (Molty + Activity Feed)")
-
-        display2_thread = threading.Thread(target=self._run_display2, name="Display2")
-        display2_thread.daemon = True
-        display2_thread.start()
-        self.threads.append(display2_thread)
-        print("[Main] Display 2 thread started (Command Panel)")
-
-        # Start touch thread
-        touch_thread = threading.Thread(target=self._run_touch, name="Touch")
-        touch_thread.daemon = True
-        touch_thread.start()
-        self.threads.append(touch_thread)
-        print("[Main] Touch handler thread started")
-
-        # Start rotary thread
-        rotary_thread = threading.Thread(target=self.rotary.run, name="Rotary")
-        rotary_thread.daemon = True
-        rotary_thread.start()
-        self.threads.append(rotary_thread)
-        print("[Main] Rotary encoder thread started")
-
-        # Start LCD ticker thread
-        lcd_thread = threading.Thread(target=self.lcd.run, name="LCD")
-        lcd_thread.daemon = True
-        lcd_thread.start()
-        self.threads.append(lcd_thread)
-        print("[Main] LCD ticker thread started")
-
-        # Start LCD state sync thread
-        lcd_sync_thread = threading.Thread(target=self._run_lcd, name="LCDSync")
-        lcd_sync_thread.daemon = True
-        lcd_sync_thread.start()
-        self.threads.append(lcd_sync_thread)
-        print("[Main] LCD sync thread started")
+        self._stop_event.clear()
+
+        # (thread name, target, startup message)
+        thread_specs = [
+            ("Display1", self._run_display1, "Display 1 thread started (Molty + Activity Feed)"),
+            ("Display2", self._run_display2, "Display 2 thread started (Command Panel)"),
+            ("Touch", self._run_touch, "Touch handler thread started"),
+            ("TouchEvents", self._run_touch_events, "Touch event thread started"),
+            ("Rotary", self.rotary.run, "Rotary encoder thread started"),
+            ("LCD", self.lcd.run, "LCD ticker thread started"),
+            ("LCDSync", self._run_lcd, "LCD sync thread started"),
+            ("Scheduler", self._run_scheduler, "Scheduler thread started"),
+        ]
+        if self.demo_mode:
+            # Interactive simulation reads stdin on its own thread
+            thread_specs.append(
+                ("DemoInput", self._demo_touch_simulation, "Demo input thread started"))
+        for name, target, message in thread_specs:
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+            print(f"[Main] {message}")
 
         print("\n[Main] System running. Press Ctrl+C to exit.\n")
 
-        # In demo mode, run interactive simulation
-        if self.demo_mode:
-            self._demo_touch_simulation()
-        else:
-            # Keep main thread alive
-            while self.running:
-                time.sleep(0.5)
+        # Keep main thread alive until stop() is called (signal handler)
+        # or quit is requested from the demo console
+        self._stop_event.wait()
+        if self.running:
+            self.stop()
 
     def stop(self):
         """Signal all components to stop."""
         print("\n[Main] Shutting down...")
         self.running = False
+        self._stop_event.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
 
-        # Cancel state timer
-        if self._molty_state_timer:
-            self._molty_state_timer.cancel()
+        # Drop pending delayed actions and wake the scheduler so it exits
+        for event in self._scheduler.queue:
+            self._cancel_scheduled(event)
+        self._scheduler_wakeup.set()
 
         self.display1.stop()
         self.display2.stop()
@@ -632,6 +727,11 @@ class DisplayCommandCenter:
         self.lcd.cleanup()
         self.bridge.cleanup()
 
+        if self._wake_r is not None:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+
         # Cleanup GPIO pins (only non-SPI pins)
         if not self.demo_mode and GPIO_AVAILABLE:
             try:
@@ -711,6 +811,13 @@ Cyberpunk UI Features:
         config_path=args.config,
     )
 
+    # Log level from the environment (or .env), e.g. OPENCLAW_LOG=DEBUG
+    log_level = logging.getLevelName(os.environ.get("OPENCLAW_LOG", "INFO").upper())
+    logging.basicConfig(
+        format="[%(name)s] %(message)s",
+        level=log_level if isinstance(log_level, int) else logging.INFO,
+    )
+
     # Create application
     app = DisplayCommandCenter(
         demo_mode=args.demo,
@@ -3,28 +3,118 @@ OpenClaw Configuration Loader.
 Loads connection settings from .env file, environment, config file, or CLI args.
 """
 
+import copy
 import json
 import os
-from dataclasses import dataclass, field
+import stat
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
-# Load .env file if python-dotenv is available
+# .env support if python-dotenv is available (the file is read on first load())
 try:
     from dotenv import load_dotenv
-    # Load from .env in current directory or home directory
+    DOTENV_AVAILABLE = True
+except ImportError:
+    load_dotenv = None
+    DOTENV_AVAILABLE = False
+
+_dotenv_loaded = False
+
+
+def _to_bool(value: str) -> bool:
+    """Parse an env var flag ("true", "1" or "yes", any case)."""
+    return value.lower() in ("true", "1", "yes")
+
+
+# Environment variable -> (config attribute, converter)
+_ENV_MAPPINGS = (
+    ("OPENCLAW_URL", "url", str),
+    ("OPENCLAW_PASSWORD", "password", str),
+    ("OPENCLAW_TAILSCALE_HOST", "tailscale_hostname", str),
+    ("OPENCLAW_AUTO_RECONNECT", "auto_reconnect", _to_bool),
+    ("OPENCLAW_RECONNECT_DELAY", "reconnect_delay", float),
+    ("OPENCLAW_TIMEOUT", "connection_timeout", float),
+)
+
+# Home directory resolved once (the working directory is still looked up
+# when needed, since it can change)
+_HOME = Path.home()
+
+# Default config file locations, highest priority first
+_DEFAULT_CONFIG_PATHS = (
+    _HOME / ".openclaw_display.json",
+    _HOME / ".config" / "openclaw_display" / "config.json",
+    Path("/etc/openclaw_display/config.json"),
+)
+
+# load() results keyed by their inputs (args, env values, config file mtimes)
+_LOAD_CACHE: dict = {}
+
+# Config file -> (mtime, parsed JSON), so an unchanged file isn't re-read
+_parsed_config_files: dict = {}
+
+
+def _config_file_paths(config_path: Optional[str] = None) -> list:
+    """Config files to try, in priority order."""
+    paths = [Path(config_path)] if config_path else []
+    paths.extend(_DEFAULT_CONFIG_PATHS)
+    return paths
+
+
+def _ensure_dotenv_loaded():
+    """Load the first .env found (current directory, then home) once."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    if not DOTENV_AVAILABLE:
+        return
+
     env_paths = [
         Path.cwd() / ".env",
-        Path.home() / ".openclaw_display.env",
+        _HOME / ".openclaw_display.env",
     ]
     for env_path in env_paths:
         if env_path.exists():
             load_dotenv(env_path)
             print(f"[Config] Loaded .env from {env_path}")
             break
-    DOTENV_AVAILABLE = True
-except ImportError:
-    DOTENV_AVAILABLE = False
+
+
+def _mtime(path: Path) -> float:
+    """Modification time of path, or 0 if it isn't an existing regular file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0
+    return st.st_mtime if stat.S_ISREG(st.st_mode) else 0
+
+
+def _config_file_state(config_path: Optional[str] = None) -> tuple:
+    """Cache key part for the config files load() would read.
+
+    Every candidate is stat'ed, so a higher-priority file appearing later
+    still takes over.
+    """
+    return tuple(_mtime(path) for path in _config_file_paths(config_path))
+
+
+def _read_config_file(path: Path) -> Optional[dict]:
+    """Parsed JSON from path (None if missing), reused while its mtime is unchanged."""
+    mtime = _mtime(path)
+    if not mtime:
+        return None
+
+    cached = _parsed_config_files.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    _parsed_config_files[path] = (mtime, data)
+    return data
 
 
 @dataclass
@@ -67,7 +157,26 @@ class OpenClawConfig:
         .env file locations (first found is used):
         - ./.env (current directory)
         - ~/.openclaw_display.env
+
+        Repeat calls with the same inputs return a copy of the cached result
+        until an env var or config file changes.
         """
+        _ensure_dotenv_loaded()
+
+        env = os.environ
+        key = (
+            cls,
+            cli_url,
+            cli_password,
+            config_path,
+            tuple(env.get(var) for var, _, _ in _ENV_MAPPINGS),
+            env.get("OPENCLAW_USE_TAILSCALE"),
+            _config_file_state(config_path),
+        )
+        cached = _LOAD_CACHE.get(key)
+        if cached is not None:
+            return copy.copy(cached)
+
         config = cls()
 
         # Load from config file first (lowest priority)
@@ -82,109 +191,64 @@ class OpenClawConfig:
         if cli_password:
             config.password = cli_password
 
+        _LOAD_CACHE[key] = copy.copy(config)
         return config
 
     def _load_from_file(self, config_path: Optional[str] = None):
         """Load settings from config file."""
-        paths_to_try = []
-
-        if config_path:
-            paths_to_try.append(Path(config_path))
-
-        # Default config locations
-        paths_to_try.extend([
-            Path.home() / ".openclaw_display.json",
-            Path.home() / ".config" / "openclaw_display" / "config.json",
-            Path("/etc/openclaw_display/config.json"),
-        ])
-
-        for path in paths_to_try:
-            if path.exists():
-                try:
-                    with open(path, "r") as f:
-                        data = json.load(f)
-                        self._apply_dict(data)
-                        print(f"[Config] Loaded from {path}")
-                        return
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"[Config] Failed to load {path}: {e}")
+        for path in _config_file_paths(config_path):
+            try:
+                data = _read_config_file(path)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"[Config] Failed to load {path}: {e}")
+                continue
+            if data is None:
+                continue
+
+            self._apply_dict(data)
+            print(f"[Config] Loaded from {path}")
+            return
 
     def _load_from_env(self):
         """Load settings from environment variables."""
-        env_mappings = {
-            "OPENCLAW_URL": "url",
-            "OPENCLAW_PASSWORD": "password",
-            "OPENCLAW_TAILSCALE_HOST": "tailscale_hostname",
-            "OPENCLAW_AUTO_RECONNECT": "auto_reconnect",
-            "OPENCLAW_RECONNECT_DELAY": "reconnect_delay",
-            "OPENCLAW_TIMEOUT": "connection_timeout",
-        }
-
-        for env_var, attr in env_mappings.items():
-            value = os.environ.get(env_var)
+        # One pass over the variables that are actually set
+        env = os.environ
+        snapshot = {var: env[var] for var, _, _ in _ENV_MAPPINGS if var in env}
+        snapshot["OPENCLAW_USE_TAILSCALE"] = env.get("OPENCLAW_USE_TAILSCALE", "")
+
+        for env_var, attr, convert in _ENV_MAPPINGS:
+            value = snapshot.get(env_var)
             if value:
-                # Type conversion
-                current = getattr(self, attr)
-                if isinstance(current, bool):
-                    value = value.lower() in ("true", "1", "yes")
-                elif isinstance(current, float):
-                    value = float(value)
-                elif isinstance(current, int):
-                    value = int(value)
-
-                setattr(self, attr, value)
-
-        # Handle USE_TAILSCALE specially
-        if os.environ.get("OPENCLAW_USE_TAILSCALE", "").lower() in ("true", "1", "yes"):
+                setattr(self, attr, convert(value))
+
+        # Handle USE_TAILSCALE specially (can only turn it on)
+        if _to_bool(snapshot["OPENCLAW_USE_TAILSCALE"]):
             self.use_tailscale = True
 
     def _apply_dict(self, data: dict):
-        """Apply dictionary values to config."""
-        mappings = {
-            "url": "url",
-            "password": "password",
-            "use_tailscale": "use_tailscale",
-            "tailscale_hostname": "tailscale_hostname",
-            "auto_reconnect": "auto_reconnect",
-            "reconnect_delay": "reconnect_delay",
-            "max_reconnect_delay": "max_reconnect_delay",
-            "connection_timeout": "connection_timeout",
-            "streaming_refresh_ms": "streaming_refresh_ms",
-            "normal_refresh_ms": "normal_refresh_ms",
-            "notification_duration": "notification_duration",
-        }
-
-        for key, attr in mappings.items():
-            if key in data:
-                setattr(self, attr, data[key])
+        """Apply dictionary values to config (keys matching field names)."""
+        allowed = self.__dataclass_fields__
+        for key, value in data.items():
+            if key in allowed:
+                setattr(self, key, value)
 
     def save(self, path: Optional[str] = None):
         """Save configuration to file."""
         if path is None:
-            path = Path.home() / ".openclaw_display.json"
+            path = _HOME / ".openclaw_display.json"
         else:
             path = Path(path)
 
-        data = {
-            "url": self.url,
-            "use_tailscale": self.use_tailscale,
-            "tailscale_hostname": self.tailscale_hostname,
-            "auto_reconnect": self.auto_reconnect,
-            "reconnect_delay": self.reconnect_delay,
-            "max_reconnect_delay": self.max_reconnect_delay,
-            "connection_timeout": self.connection_timeout,
-            "streaming_refresh_ms": self.streaming_refresh_ms,
-            "normal_refresh_ms": self.normal_refresh_ms,
-            "notification_duration": self.notification_duration,
-        }
-
         # Don't save password to file for security
         # (use environment variable instead)
+        data = {f.name: getattr(self, f.name) for f in fields(self)
+                if f.name != "password"}
 
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
             with open(path, "w") as f:
                 json.dump(data, f, indent=2)
+            _LOAD_CACHE.clear()
             print(f"[Config] Saved to {path}")
         except IOError as e:
             print(f"[Config] Failed to save: {e}")
@@ -209,12 +273,8 @@ class OpenClawConfig:
         )
 
 
-def create_sample_config(path: Optional[str] = None, create_env: bool = True):
-    """Create sample configuration files (.env and .json)."""
-    # Create .env file
-    if create_env:
-        env_path = Path.cwd() / ".env"
-        env_content = """# OpenClaw Display Configuration
+# Sample files written by create_sample_config()
+_SAMPLE_ENV = """# OpenClaw Display Configuration
 # Copy this file to your project directory or ~/.openclaw_display.env
 
 # Required: WebSocket URL to your OpenClaw instance
@@ -233,45 +293,54 @@ OPENCLAW_AUTO_RECONNECT=true
 OPENCLAW_RECONNECT_DELAY=1.0
 OPENCLAW_TIMEOUT=30.0
 """
+
+_SAMPLE_JSON = json.dumps({
+    "url": "ws://100.x.x.x:18789",
+    "use_tailscale": True,
+    "tailscale_hostname": "your-openclaw-server",
+    "auto_reconnect": True,
+    "reconnect_delay": 1.0,
+    "max_reconnect_delay": 60.0,
+    "connection_timeout": 30.0,
+    "streaming_refresh_ms": 100,
+    "normal_refresh_ms": 1000,
+    "notification_duration": 2.0,
+}, indent=2)
+
+_SAMPLE_HELP = """
+[Config] Configuration priority (highest to lowest):
+  1. CLI arguments (--url, --password)
+  2. Environment variables / .env file
+  3. JSON config file (~/.openclaw_display.json)
+
+[Config] Edit .env and set your OpenClaw server URL and password"""
+
+
+def create_sample_config(path: Optional[str] = None, create_env: bool = True):
+    """Create sample configuration files (.env and .json)."""
+    # Create .env file
+    if create_env:
+        env_path = Path.cwd() / ".env"
         try:
-            with open(env_path, "w") as f:
-                f.write(env_content)
+            env_path.write_text(_SAMPLE_ENV)
             print(f"[Config] Sample .env created at {env_path}")
         except IOError as e:
             print(f"[Config] Failed to create .env: {e}")
 
     # Create JSON config file
     if path is None:
-        path = Path.home() / ".openclaw_display.json"
+        path = _HOME / ".openclaw_display.json"
     else:
         path = Path(path)
 
-    sample = {
-        "url": "ws://100.x.x.x:18789",
-        "use_tailscale": True,
-        "tailscale_hostname": "your-openclaw-server",
-        "auto_reconnect": True,
-        "reconnect_delay": 1.0,
-        "max_reconnect_delay": 60.0,
-        "connection_timeout": 30.0,
-        "streaming_refresh_ms": 100,
-        "normal_refresh_ms": 1000,
-        "notification_duration": 2.0,
-    }
-
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(sample, f, indent=2)
+        path.write_text(_SAMPLE_JSON)
         print(f"[Config] Sample JSON config created at {path}")
     except IOError as e:
         print(f"[Config] Failed to create JSON config: {e}")
 
-    print("\n[Config] Configuration priority (highest to lowest):")
-    print("  1. CLI arguments (--url, --password)")
-    print("  2. Environment variables / .env file")
-    print("  3. JSON config file (~/.openclaw_display.json)")
-    print("\n[Config] Edit .env and set your OpenClaw server URL and password")
+    print(_SAMPLE_HELP)
 
 
 if __name__ == "__main__":
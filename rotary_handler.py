@@ -2,9 +2,11 @@
 Rotary Encoder Handler for KY-040 or similar rotary encoders.
 Handles rotation and button press input for navigation.
 
-Uses RPi.GPIO with polling mode for compatibility.
+Uses RPi.GPIO edge detection (callbacks from RPi.GPIO's C thread), falling
+back to polling where edge detection isn't available.
 """
 
+import logging
 import threading
 import time
 
@@ -16,20 +18,34 @@ except ImportError:
 
 import config
 
+# Quadrature decode: _QUAD_TABLE[(previous << 2) | current] with state = (CLK << 1) | DT
+# gives +1 (clockwise step), -1 (counter-clockwise step) or 0 (no move / invalid jump)
+_QUAD_TABLE = (0, -1, 1, 0,
+               1, 0, 0, -1,
+               -1, 0, 0, 1,
+               0, 1, -1, 0)
+_QUAD_REST = 0b11  # Both lines pulled high at a detent
+
+# Per-event diagnostics. Debug lines (every rotation) are skipped without
+# formatting unless OPENCLAW_LOG=DEBUG; one-time messages still use print.
+log = logging.getLogger("Rotary")
+
 
 class RotaryHandler:
-    """Handles rotary encoder input using GPIO polling."""
+    """Handles rotary encoder input using GPIO edge callbacks or polling."""
 
     def __init__(self, demo_mode=False):
         self.demo_mode = demo_mode
         self.running = False
-        self.lock = threading.Lock()
 
         # Get pin configuration
         encoder_config = config.ROTARY_ENCODER
         self.clk_pin = encoder_config["clk_pin"]
         self.dt_pin = encoder_config["dt_pin"]
         self.sw_pin = encoder_config["sw_pin"]
+        self.bouncetime_rotation = encoder_config.get("bouncetime_rotation", 2)
+        self.bouncetime_button = encoder_config.get("bouncetime_button", 300)
+        self.idle_backoff = encoder_config.get("idle_backoff", ())
 
         # Callbacks
         self.on_rotate_cw = None   # Clockwise rotation
@@ -37,10 +53,15 @@ class RotaryHandler:
         self.on_button_press = None  # Button press
 
         # State tracking
-        self._last_clk_state = None
+        self._last_quad_state = None
+        self._quad_steps = 0  # Net steps since the last detent
         self._last_button_state = None
         self._initialized = False
 
+        # True when edges arrive via callbacks instead of the polling loop
+        self._edge_mode = False
+        self._stop_event = threading.Event()
+
     def initialize(self):
         """Initialize GPIO pins for the rotary encoder."""
         if self.demo_mode:
@@ -59,49 +80,107 @@ class RotaryHandler:
             GPIO.setup(self.sw_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
             # Read initial states
-            self._last_clk_state = GPIO.input(self.clk_pin)
+            self._last_quad_state = (GPIO.input(self.clk_pin) << 1) | GPIO.input(self.dt_pin)
             self._last_button_state = GPIO.input(self.sw_pin)
 
+            self._setup_edge_detect()
+
             self._initialized = True
-            print(f"[Rotary] Initialized (CLK={self.clk_pin}, DT={self.dt_pin}, SW={self.sw_pin})")
+            mode = "edge detect" if self._edge_mode else "polling"
+            print(f"[Rotary] Initialized (CLK={self.clk_pin}, DT={self.dt_pin}, SW={self.sw_pin}, {mode})")
             return True
 
         except Exception as e:
             print(f"[Rotary] Initialization failed: {e}")
             return False
 
+    def _setup_edge_detect(self):
+        """Register falling-edge callbacks for CLK and SW (polling if unavailable)."""
+        try:
+            GPIO.add_event_detect(self.clk_pin, GPIO.FALLING,
+                                  callback=self._on_clk_edge,
+                                  bouncetime=self.bouncetime_rotation)
+            GPIO.add_event_detect(self.sw_pin, GPIO.FALLING,
+                                  callback=self._on_button_edge,
+                                  bouncetime=self.bouncetime_button)
+            self._edge_mode = True
+        except RuntimeError as e:
+            # Some kernel/RPi.GPIO combinations can't do edge detection
+            print(f"[Rotary] Edge detection unavailable ({e}), using polling")
+            self._remove_edge_detect()
+            self._edge_mode = False
+
+    def _remove_edge_detect(self):
+        """Unregister edge callbacks (safe if none are registered)."""
+        for pin in (self.clk_pin, self.sw_pin):
+            try:
+                GPIO.remove_event_detect(pin)
+            except Exception:
+                pass
+
+    def _on_clk_edge(self, channel):
+        """CLK falling edge: DT high means clockwise."""
+        try:
+            if GPIO.input(self.dt_pin) == 1:
+                if self.on_rotate_cw:
+                    self.on_rotate_cw()
+            else:
+                if self.on_rotate_ccw:
+                    self.on_rotate_ccw()
+        except Exception as e:
+            log.error("Rotation callback error: %s", e)
+
+    def _on_button_edge(self, channel):
+        """SW falling edge: button pressed."""
+        try:
+            if self.on_button_press:
+                self.on_button_press()
+        except Exception as e:
+            log.error("Button callback error: %s", e)
+
     def _poll_encoder(self):
-        """Poll the encoder and trigger callbacks on state changes."""
+        """Poll the encoder and trigger callbacks on state changes.
+
+        Returns:
+            True if either input changed since the last poll
+        """
         if not self._initialized or self.demo_mode:
-            return
+            return False
 
         try:
             # Read current states
-            clk_state = GPIO.input(self.clk_pin)
-            dt_state = GPIO.input(self.dt_pin)
+            quad_state = (GPIO.input(self.clk_pin) << 1) | GPIO.input(self.dt_pin)
             button_state = GPIO.input(self.sw_pin)
 
-            # Check for rotation (CLK changed)
-            if clk_state != self._last_clk_state:
-                if clk_state == 0:  # Falling edge
-                    if dt_state == 1:
+            changed = (quad_state != self._last_quad_state or
+                       button_state != self._last_button_state)
+
+            # Check for rotation: count quadrature steps, report once per detent
+            if quad_state != self._last_quad_state:
+                self._quad_steps += _QUAD_TABLE[(self._last_quad_state << 2) | quad_state]
+                self._last_quad_state = quad_state
+
+                if quad_state == _QUAD_REST:
+                    steps, self._quad_steps = self._quad_steps, 0
+                    if steps >= 2:
                         # Clockwise rotation
                         if self.on_rotate_cw:
                             self.on_rotate_cw()
-                    else:
+                    elif steps <= -2:
                         # Counter-clockwise rotation
                         if self.on_rotate_ccw:
                             self.on_rotate_ccw()
-                self._last_clk_state = clk_state
 
             # Check for button press (falling edge)
             if button_state == 0 and self._last_button_state == 1:
                 if self.on_button_press:
                     self.on_button_press()
             self._last_button_state = button_state
+            return changed
 
         except Exception as e:
-            print(f"[Rotary] Poll error: {e}")
+            log.error("Poll error: %s", e)
+            return False
 
     def simulate_rotation(self, direction="cw"):
         """Simulate a rotation event (for demo mode).
@@ -110,40 +189,67 @@ class RotaryHandler:
             direction: "cw" for clockwise, "ccw" for counter-clockwise
         """
         if direction == "cw":
-            print("[Rotary] Simulated CW rotation")
+            log.debug("Simulated CW rotation")
             if self.on_rotate_cw:
                 self.on_rotate_cw()
         elif direction == "ccw":
-            print("[Rotary] Simulated CCW rotation")
+            log.debug("Simulated CCW rotation")
             if self.on_rotate_ccw:
                 self.on_rotate_ccw()
 
     def simulate_button(self):
         """Simulate a button press (for demo mode)."""
-        print("[Rotary] Simulated button press")
+        log.debug("Simulated button press")
         if self.on_button_press:
             self.on_button_press()
 
     def run(self):
-        """Main polling loop."""
+        """Main loop (just waits for stop() when edge callbacks are active)."""
         self.running = True
+
+        if self._edge_mode and not self.demo_mode:
+            print("[Rotary] Starting rotary handler (edge detect mode)")
+            self._stop_event.wait()
+            print("[Rotary] Rotary handler stopped")
+            return
+
         print("[Rotary] Starting rotary handler (polling mode)")
 
+        # Bound once; this loop runs up to ~1000 times a second
+        sleep = time.sleep
+        poll = self._poll_encoder
+
+        # Idle time, summed from the sleeps, drives the backoff in idle_backoff
+        backoff = self.idle_backoff
+        idle = 0.0
+
         while self.running:
             if self.demo_mode:
-                time.sleep(0.1)
+                sleep(0.1)
+                continue
+
+            interval = 0.001  # 1ms polling interval while in use
+            if poll():
+                idle = 0.0
             else:
-                self._poll_encoder()
-                time.sleep(0.001)  # 1ms polling interval
+                for after, slower in backoff:
+                    if idle >= after:
+                        interval = slower
+                idle += interval
+            sleep(interval)
 
         print("[Rotary] Rotary handler stopped")
 
     def stop(self):
         """Stop the rotary handler."""
         self.running = False
+        self._stop_event.set()
 
     def cleanup(self):
         """Clean up resources."""
         self.stop()
+        if self._edge_mode:
+            self._remove_edge_detect()
+            self._edge_mode = False
         self._initialized = False
         print("[Rotary] Cleanup complete")
@@ -4,10 +4,14 @@ Handles touch input on the 2.8" status display.
 
 Uses RPi.GPIO for CS control (not lgpio) to avoid SPI corruption.
 Uses polling mode since IRQ pin may not be connected.
+Touch events are queued by the polling thread and their callbacks run on
+whichever thread calls process_events().
 """
 
+import logging
 import threading
 import time
+from collections import deque
 
 try:
     import spidev
@@ -19,6 +23,10 @@ except ImportError:
 import config
 from spi_lock import spi_lock
 
+# Per-event diagnostics. Debug lines (every tap) are skipped without
+# formatting unless OPENCLAW_LOG=DEBUG; one-time messages still use print.
+log = logging.getLogger("Touch")
+
 
 class TouchHandler:
     """Handles XPT2046 touch controller input using polling mode."""
@@ -28,11 +36,13 @@ class TouchHandler:
     CMD_Y_POSITION = 0x90  # Y position command
     CMD_Z_POSITION = 0xB0  # Z (pressure) command
 
+    # Polls skipped while a display holds the SPI bus before we wait for it
+    MAX_SKIPPED_POLLS = 10
+
     def __init__(self, demo_mode=False):
         self.demo_mode = demo_mode
         self.spi = None
         self.running = False
-        self.lock = threading.Lock()
 
         # Callbacks
         self.on_tap_top = None      # Tap on top half
@@ -42,8 +52,46 @@ class TouchHandler:
         # Touch state
         self.touch_start_time = None
         self.long_press_threshold = 1.0  # seconds
-        self.debounce_ms = 100  # Debounce time in milliseconds
-        self.last_touch_time = 0
+        self.debounce_s = 0.1  # Debounce time in seconds
+        self.last_touch_time = 0  # time.monotonic() of the last accepted tap
+
+        # (kind, x, y) events waiting for process_events(); oldest dropped if full
+        self.event_queue = deque(maxlen=16)
+        self._events_ready = threading.Event()
+
+        # Reported again when a poll is skipped because the bus is busy
+        self._last_reading = (0, 0, 0, False)
+        self._skipped_polls = 0
+
+        # Calibration folded into x = raw * scale + offset (same for y)
+        touch = config.TOUCH
+        width = config.SMALL_DISPLAY["width"]
+        height = config.SMALL_DISPLAY["height"]
+        self._cs_pin = touch["cs_pin"]
+        self._min_pressure = touch["min_pressure"]
+        self._swap_xy = touch["swap_xy"]
+        self._max_x = width - 1
+        self._max_y = height - 1
+        self._x_scale, self._x_offset = self._linear_map(
+            touch["x_min"], touch["x_max"], width, touch["invert_x"])
+        self._y_scale, self._y_offset = self._linear_map(
+            touch["y_min"], touch["y_max"], height, touch["invert_y"])
+
+        # X, Y and Z conversions back to back (command byte + 2 result bytes each)
+        self._tx_buf = [self.CMD_X_POSITION, 0x00, 0x00,
+                        self.CMD_Y_POSITION, 0x00, 0x00,
+                        self.CMD_Z_POSITION, 0x00, 0x00]
+        # Idle polls: pressure first, position only once something presses
+        self._z_buf = [self.CMD_Z_POSITION, 0x00, 0x00]
+        self._xy_buf = self._tx_buf[:6]
+
+    @staticmethod
+    def _linear_map(raw_min, raw_max, size, invert):
+        """Return (scale, offset) mapping raw_min..raw_max onto 0..size."""
+        scale = size / (raw_max - raw_min)
+        if invert:
+            return -scale, raw_max * scale
+        return scale, -raw_min * scale
 
     def initialize(self):
         """Initialize SPI and GPIO for touch controller."""
@@ -57,8 +105,8 @@ class TouchHandler:
 
         try:
             # Setup CS pin via RPi.GPIO (manual chip select)
-            GPIO.setup(config.TOUCH["cs_pin"], GPIO.OUT)
-            GPIO.output(config.TOUCH["cs_pin"], GPIO.HIGH)  # Deselected
+            GPIO.setup(self._cs_pin, GPIO.OUT)
+            GPIO.output(self._cs_pin, GPIO.HIGH)  # Deselected
 
             # Use spidev with no_cs mode - we control CS manually via GPIO 17
             self.spi = spidev.SpiDev()
@@ -74,104 +122,176 @@ class TouchHandler:
             print(f"[Touch] Initialization failed: {e}")
             return False
 
+    def _transfer(self, tx):
+        """Run one xfer2 with the touch controller selected.
+
+        Returns None instead of waiting if a display is mid-frame on the SPI bus,
+        up to MAX_SKIPPED_POLLS times in a row.
+        """
+        if not spi_lock.acquire(blocking=False):
+            if self._skipped_polls < self.MAX_SKIPPED_POLLS:
+                self._skipped_polls += 1
+                return None
+            spi_lock.acquire()
+        self._skipped_polls = 0
+
+        try:
+            # Select touch controller
+            GPIO.output(self._cs_pin, GPIO.LOW)
+
+            # Conversions are sent in one transfer. CS stays low throughout, so
+            # the bus sees the same 24-clock conversions as separate xfers.
+            result = self.spi.xfer2(tx)
+
+            # Deselect touch controller
+            GPIO.output(self._cs_pin, GPIO.HIGH)
+        finally:
+            spi_lock.release()
+
+        return result
+
+    def _probe_pressure(self):
+        """Read only Z (3 bytes). Returns None if the poll was skipped."""
+        result = self._transfer(self._z_buf)
+        if result is None:
+            return None
+        return ((result[1] << 8) | result[2]) >> 3
+
+    def _read_xy(self):
+        """Read raw X and Y (6 bytes). Returns None if the poll was skipped."""
+        result = self._transfer(self._xy_buf)
+        if result is None:
+            return None
+        return (((result[1] << 8) | result[2]) >> 3,
+                ((result[4] << 8) | result[5]) >> 3)
+
     def _read_touch(self):
         """Read touch coordinates using pressure-based polling.
 
         Returns (x, y, z, touched) where touched is True if pressure exceeds threshold.
+        While idle only the pressure is read; X/Y follow once it passes the threshold.
+        A skipped poll (SPI bus busy) returns the previous reading.
         """
         if not self.spi:
             return 0, 0, 0, False
 
         try:
-            with spi_lock:
-                # Select touch controller
-                GPIO.output(config.TOUCH["cs_pin"], GPIO.LOW)
-
-                # Read X, Y, Z with separate commands for reliability
-                x_result = self.spi.xfer2([self.CMD_X_POSITION, 0x00, 0x00])
-                y_result = self.spi.xfer2([self.CMD_Y_POSITION, 0x00, 0x00])
-                z_result = self.spi.xfer2([self.CMD_Z_POSITION, 0x00, 0x00])
-
-                # Deselect touch controller
-                GPIO.output(config.TOUCH["cs_pin"], GPIO.HIGH)
+            if self._last_reading[3]:
+                # Already touching: read everything so a release is seen
+                result = self._transfer(self._tx_buf)
+                if result is None:
+                    return self._last_reading
+
+                # Parse 12-bit values
+                x_raw = ((result[1] << 8) | result[2]) >> 3
+                y_raw = ((result[4] << 8) | result[5]) >> 3
+                z_raw = ((result[7] << 8) | result[8]) >> 3
+            else:
+                z_raw = self._probe_pressure()
+                if z_raw is None or z_raw <= self._min_pressure:
+                    return self._last_reading
 
-            # Parse 12-bit values
-            x_raw = ((x_result[1] << 8) | x_result[2]) >> 3
-            y_raw = ((y_result[1] << 8) | y_result[2]) >> 3
-            z_raw = ((z_result[1] << 8) | z_result[2]) >> 3
+                xy = self._read_xy()
+                if xy is None:
+                    return self._last_reading
+                x_raw, y_raw = xy
 
             # Check if this is a valid touch (pressure above threshold, values in range)
-            touched = (z_raw > config.TOUCH["min_pressure"] and
+            touched = (z_raw > self._min_pressure and
                        100 < x_raw < 4000 and
                        100 < y_raw < 4000)
 
             if not touched:
-                return 0, 0, 0, False
+                self._last_reading = (0, 0, 0, False)
+                return self._last_reading
 
             # Apply calibration
-            if config.TOUCH["swap_xy"]:
+            if self._swap_xy:
                 x_raw, y_raw = y_raw, x_raw
 
             # Map to screen coordinates
-            x_min = config.TOUCH["x_min"]
-            x_max = config.TOUCH["x_max"]
-            y_min = config.TOUCH["y_min"]
-            y_max = config.TOUCH["y_max"]
-            width = config.SMALL_DISPLAY["width"]
-            height = config.SMALL_DISPLAY["height"]
-
-            if config.TOUCH["invert_x"]:
-                x = int((x_max - x_raw) / (x_max - x_min) * width)
-            else:
-                x = int((x_raw - x_min) / (x_max - x_min) * width)
-
-            if config.TOUCH["invert_y"]:
-                y = int((y_max - y_raw) / (y_max - y_min) * height)
-            else:
-                y = int((y_raw - y_min) / (y_max - y_min) * height)
+            x = int(x_raw * self._x_scale + self._x_offset)
+            y = int(y_raw * self._y_scale + self._y_offset)
 
             # Clamp to screen bounds
-            x = max(0, min(width - 1, x))
-            y = max(0, min(height - 1, y))
+            x = max(0, min(self._max_x, x))
+            y = max(0, min(self._max_y, y))
 
-            return x, y, z_raw, True
+            self._last_reading = (x, y, z_raw, True)
+            return self._last_reading
 
         except Exception as e:
-            print(f"[Touch] Read error: {e}")
+            log.error("Read error: %s", e)
             return 0, 0, 0, False
 
     def _handle_touch(self, x, y, duration):
-        """Process a touch event based on location and duration."""
+        """Queue a touch event based on location and duration."""
         screen_height = config.SMALL_DISPLAY["height"]
 
         if duration >= self.long_press_threshold:
             # Long press
-            print(f"[Touch] Long press detected at ({x}, {y})")
-            if self.on_long_press:
-                self.on_long_press(x, y)
+            log.debug("Long press detected at (%d, %d)", x, y)
+            kind = "long_press"
         elif y < screen_height // 2:
             # Top half tap
-            print(f"[Touch] Top tap at ({x}, {y})")
-            if self.on_tap_top:
-                self.on_tap_top(x, y)
+            log.debug("Top tap at (%d, %d)", x, y)
+            kind = "top"
         else:
             # Bottom half tap
-            print(f"[Touch] Bottom tap at ({x}, {y})")
-            if self.on_tap_bottom:
-                self.on_tap_bottom(x, y)
+            log.debug("Bottom tap at (%d, %d)", x, y)
+            kind = "bottom"
+
+        # deque.append is atomic, so the consumer needs no lock
+        self.event_queue.append((kind, x, y))
+        self._events_ready.set()
+
+    def drain_events(self):
+        """Yield queued (kind, x, y) touch events, oldest first."""
+        queue = self.event_queue
+        while queue:
+            try:
+                yield queue.popleft()
+            except IndexError:
+                return
+
+    def process_events(self, timeout=None):
+        """Wait for queued touch events and run their callbacks.
+
+        Called in a loop from the consumer thread, so slow callbacks never hold
+        up the polling thread.
+
+        Args:
+            timeout: Seconds to wait for an event (None waits until one arrives)
+        """
+        self._events_ready.wait(timeout)
+        self._events_ready.clear()
+
+        for kind, x, y in self.drain_events():
+            if kind == "long_press":
+                callback = self.on_long_press
+            elif kind == "top":
+                callback = self.on_tap_top
+            else:
+                callback = self.on_tap_bottom
+
+            if callback:
+                try:
+                    callback(x, y)
+                except Exception as e:
+                    log.error("Callback error: %s", e)
 
     def simulate_touch(self, region):
         """Simulate a touch event (for demo mode)."""
         if region == "top":
-            print("[Touch] Simulated top tap")
+            log.debug("Simulated top tap")
             if self.on_tap_top:
                 self.on_tap_top(160, 60)
         elif region == "bottom":
-            print("[Touch] Simulated bottom tap")
+            log.debug("Simulated bottom tap")
             if self.on_tap_bottom:
                 self.on_tap_bottom(160, 180)
         elif region == "long":
-            print("[Touch] Simulated long press")
+            log.debug("Simulated long press")
             if self.on_long_press:
                 self.on_long_press(160, 120)
 
@@ -179,6 +299,8 @@ class TouchHandler:
         """Main touch polling loop.
 
         Uses state transition detection (not-touched -> touched) for instant response.
+        Polls at poll_interval while in use and backs off per TOUCH["idle_backoff"]
+        once the panel has been idle for a while.
         """
         self.running = True
         print("[Touch] Starting touch handler (polling mode)")
@@ -186,40 +308,57 @@ class TouchHandler:
         was_touched = False
         touch_x, touch_y = None, None
 
+        # Bound once; this loop runs every poll_interval
+        sleep = time.sleep
+        now = time.monotonic
+        read_touch = self._read_touch
+
+        # (idle seconds, interval) steps, and roughly how long the panel has
+        # been idle (summed from the sleeps, so idle polls never read the clock)
+        backoff = config.TOUCH.get("idle_backoff", ())
+        idle = 0.0
+
         while self.running:
             try:
                 if self.demo_mode:
                     # In demo mode, just sleep (touches are simulated externally)
-                    time.sleep(0.1)
+                    sleep(0.1)
                     continue
 
-                current_time = time.time() * 1000  # milliseconds
-
                 # Poll touch controller
-                x, y, z, is_touching = self._read_touch()
+                x, y, z, is_touching = read_touch()
 
                 # Detect tap (transition from not-touched to touched)
-                tap_detected = is_touching and not was_touched
-
-                if tap_detected and (current_time - self.last_touch_time) > self.debounce_ms:
-                    # Touch started
-                    self.touch_start_time = time.time()
-                    touch_x, touch_y = x, y
-                    self.last_touch_time = current_time
+                if is_touching and not was_touched:
+                    current_time = now()
+                    if (current_time - self.last_touch_time) > self.debounce_s:
+                        # Touch started
+                        self.touch_start_time = current_time
+                        touch_x, touch_y = x, y
+                        self.last_touch_time = current_time
 
                 elif not is_touching and was_touched:
                     # Touch ended - process the event
                     if self.touch_start_time and touch_x is not None:
-                        duration = time.time() - self.touch_start_time
+                        duration = now() - self.touch_start_time
                         self._handle_touch(touch_x, touch_y, duration)
                     self.touch_start_time = None
                     touch_x, touch_y = None, None
 
                 was_touched = is_touching
-                time.sleep(poll_interval)
+
+                interval = poll_interval
+                if is_touching:
+                    idle = 0.0
+                else:
+                    for after, slower in backoff:
+                        if idle >= after:
+                            interval = slower
+                    idle += interval
+                sleep(interval)
 
             except Exception as e:
-                print(f"[Touch] Error: {e}")
+                log.error("Error: %s", e)
                 time.sleep(0.1)
 
         print("[Touch] Touch handler stopped")
@@ -227,6 +366,7 @@ class TouchHandler:
     def stop(self):
         """Stop the touch handler."""
         self.running = False
+        self._events_ready.set()  # Wake process_events()
 
     def cleanup(self):
         """Clean up resources."""
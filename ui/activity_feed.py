@@ -3,12 +3,15 @@ Activity Feed for the large display.
 Shows recent activities with colored type indicators.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Deque, Optional
 from PIL import Image, ImageDraw
 
-from .cyberpunk_theme import COLORS, CyberpunkTheme
+from .cyberpunk_theme import COLORS, CyberpunkTheme, text_bbox
 
 
 @dataclass
@@ -50,6 +53,8 @@ class ActivityFeed:
 
     MAX_VISIBLE = 5
     ENTRY_HEIGHT = 54
+    HEADER_HEIGHT = 30
+    FOOTER_HEIGHT = 20
 
     def __init__(self, theme: CyberpunkTheme = None):
         """
@@ -59,8 +64,9 @@ class ActivityFeed:
             theme: CyberpunkTheme instance (creates one if not provided)
         """
         self.theme = theme or CyberpunkTheme()
-        self.entries: List[ActivityEntry] = []
         self._max_entries = 20  # Keep more in memory for scrolling
+        # Oldest entries fall off the left as new ones are appended
+        self.entries: Deque[ActivityEntry] = deque(maxlen=self._max_entries)
 
     def add_entry(self, type_: str, title: str, detail: str = "", status: str = "done"):
         """
@@ -81,10 +87,6 @@ class ActivityFeed:
         )
         self.entries.append(entry)
 
-        # Trim old entries
-        if len(self.entries) > self._max_entries:
-            self.entries = self.entries[-self._max_entries:]
-
     def update_latest_status(self, status: str):
         """Update the status of the most recent entry."""
         if self.entries:
@@ -92,17 +94,18 @@ class ActivityFeed:
 
     def clear(self):
         """Clear all entries."""
-        self.entries = []
+        self.entries.clear()
 
-    def render(self, draw: ImageDraw.Draw, rect: tuple, status_text: str = "Waiting for commands...", scroll_offset: int = 0):
+    def render_chrome(self, draw: ImageDraw.Draw, rect: tuple):
         """
-        Render the activity feed.
+        Render the static parts of the feed (panel, header and footer bars).
+
+        Callers that keep a pre-rendered background can draw this once and
+        pass chrome=False to render() on every frame.
 
         Args:
             draw: ImageDraw object
             rect: (x, y, width, height) rectangle to render in
-            status_text: Footer status text
-            scroll_offset: Number of entries to scroll back (0 = newest at top)
         """
         x, y, width, height = rect
 
@@ -112,13 +115,34 @@ class ActivityFeed:
             fill=COLORS["panel_bg"]
         )
 
+        self._draw_header_chrome(draw, x, y, width, self.HEADER_HEIGHT)
+        self._draw_footer_chrome(draw, x, y + height - self.FOOTER_HEIGHT,
+                                 width, self.FOOTER_HEIGHT)
+
+    def render(self, draw: ImageDraw.Draw, rect: tuple, status_text: str = "Waiting for commands...",
+               scroll_offset: int = 0, chrome: bool = True):
+        """
+        Render the activity feed.
+
+        Args:
+            draw: ImageDraw object
+            rect: (x, y, width, height) rectangle to render in
+            status_text: Footer status text
+            scroll_offset: Number of entries to scroll back (0 = newest at top)
+            chrome: Also draw the static parts (False if already drawn)
+        """
+        x, y, width, height = rect
+
+        if chrome:
+            self.render_chrome(draw, rect)
+
         # Header
-        header_height = 30
+        header_height = self.HEADER_HEIGHT
         self._draw_header(draw, x, y, width, header_height)
 
         # Entries area
         entries_y = y + header_height
-        entries_height = height - header_height - 20  # Leave room for footer
+        entries_height = height - header_height - self.FOOTER_HEIGHT
 
         # Calculate visible entries with scroll offset
         total_entries = len(self.entries)
@@ -132,7 +156,8 @@ class ActivityFeed:
             end_idx = total_entries - scroll_offset
             start_idx = max(0, end_idx - self.MAX_VISIBLE)
 
-            visible_entries = list(reversed(self.entries[start_idx:end_idx]))
+            visible_entries = list(islice(self.entries, start_idx, end_idx))
+            visible_entries.reverse()
         else:
             visible_entries = []
 
@@ -145,11 +170,11 @@ class ActivityFeed:
             entry_y += self.ENTRY_HEIGHT
 
         # Footer status bar
-        footer_y = y + height - 20
-        self._draw_footer(draw, x, footer_y, width, 20, status_text)
+        footer_y = y + height - self.FOOTER_HEIGHT
+        self._draw_footer(draw, x, footer_y, width, self.FOOTER_HEIGHT, status_text)
 
-    def _draw_header(self, draw: ImageDraw.Draw, x: int, y: int, width: int, height: int):
-        """Draw the activity feed header."""
+    def _draw_header_chrome(self, draw: ImageDraw.Draw, x: int, y: int, width: int, height: int):
+        """Draw the static parts of the activity feed header."""
         # Header background
         draw.rectangle(
             [x, y, x + width, y + height],
@@ -165,10 +190,19 @@ class ActivityFeed:
             fill=COLORS["neon_cyan"]
         )
 
+        # Separator line
+        draw.line(
+            [(x, y + height - 1), (x + width, y + height - 1)],
+            fill=COLORS["neon_cyan"],
+            width=1
+        )
+
+    def _draw_header(self, draw: ImageDraw.Draw, x: int, y: int, width: int, height: int):
+        """Draw the dynamic parts of the activity feed header (clock)."""
         # Timestamp (right side)
         time_str = datetime.now().strftime("%H:%M:%S")
         time_font = self.theme.get_font("mono", "small")
-        time_bbox = time_font.getbbox(time_str)
+        time_bbox = text_bbox(time_font, time_str)
         time_width = time_bbox[2] - time_bbox[0]
         draw.text(
             (x + width - time_width - 10, y + 8),
@@ -177,13 +211,6 @@ class ActivityFeed:
             fill=COLORS["text_dim"]
         )
 
-        # Separator line
-        draw.line(
-            [(x, y + height - 1), (x + width, y + height - 1)],
-            fill=COLORS["neon_cyan"],
-            width=1
-        )
-
     def _draw_entry(self, draw: ImageDraw.Draw, entry: ActivityEntry,
                     x: int, y: int, width: int, height: int):
         """Draw a single activity entry."""
@@ -256,9 +283,9 @@ class ActivityFeed:
             fill=COLORS["text_dim"]
         )
 
-    def _draw_footer(self, draw: ImageDraw.Draw, x: int, y: int,
-                     width: int, height: int, status_text: str):
-        """Draw the footer status bar."""
+    def _draw_footer_chrome(self, draw: ImageDraw.Draw, x: int, y: int,
+                            width: int, height: int):
+        """Draw the static parts of the footer status bar."""
         # Footer background
         draw.rectangle(
             [x, y, x + width, y + height],
@@ -272,15 +299,16 @@ class ActivityFeed:
             width=1
         )
 
-        # Status text with blinking cursor indicator
-        font = self.theme.get_font("mono", "small")
-
         # Cursor block
         draw.rectangle(
             [x + 8, y + 4, x + 12, y + height - 4],
             fill=COLORS["neon_cyan"]
         )
 
+    def _draw_footer(self, draw: ImageDraw.Draw, x: int, y: int,
+                     width: int, height: int, status_text: str):
+        """Draw the footer status text."""
+        font = self.theme.get_font("mono", "small")
         draw.text(
             (x + 18, y + 3),
             status_text,
@@ -292,19 +320,29 @@ class ActivityFeed:
         """Truncate text to fit within max_width."""
         if not text:
             return ""
+        return _truncate_text(text, font, max_width)
+
 
-        bbox = font.getbbox(text)
-        text_width = bbox[2] - bbox[0]
+@lru_cache(maxsize=128)
+def _truncate_text(text: str, font, max_width: int) -> str:
+    """
+    Truncate text to fit within max_width (memoized).
+
+    Visible entries are redrawn every frame with the same text, so the
+    measure-and-shorten loop only runs once per entry.
+    """
+    bbox = font.getbbox(text)
+    text_width = bbox[2] - bbox[0]
 
-        if text_width <= max_width:
-            return text
+    if text_width <= max_width:
+        return text
 
-        # Binary search for truncation point
-        ellipsis = "..."
-        for i in range(len(text), 0, -1):
-            truncated = text[:i] + ellipsis
-            bbox = font.getbbox(truncated)
-            if bbox[2] - bbox[0] <= max_width:
-                return truncated
+    # Binary search for truncation point
+    ellipsis = "..."
+    for i in range(len(text), 0, -1):
+        truncated = text[:i] + ellipsis
+        bbox = font.getbbox(truncated)
+        if bbox[2] - bbox[0] <= max_width:
+            return truncated
 
-        return ellipsis
+    return ellipsis
@@ -9,7 +9,7 @@ from datetime import datetime
 import time
 from PIL import Image, ImageDraw
 
-from .cyberpunk_theme import COLORS, CyberpunkTheme
+from .cyberpunk_theme import COLORS, CyberpunkTheme, text_bbox
 
 
 @dataclass
@@ -127,6 +127,9 @@ class CommandPanel:
         ]
         self._button_flash_times = {}  # Track when buttons were pressed for flash timing
         self._last_layout_size = None  # Track last layout size to avoid redundant recalc
+        self._button_tiles = {}  # Pre-rendered button faces by (label, state, size)
+        self._scanline_masks = {}  # Scanline masks by (size, spacing, opacity)
+        self._status_bar_tiles = {}  # Rendered status bars by displayed content
 
     def layout_buttons(self, width: int, height: int):
         """Recalculate button positions for the given content dimensions."""
@@ -240,14 +243,34 @@ class CommandPanel:
         draw.rectangle([0, 0, width, height], fill=COLORS["background"])
 
         # Status bar at top
-        self._draw_status_bar(draw, 0, 0, width, 35, connected, model, cost)
+        image.paste(self._status_bar_tile(width, 35, connected, model, cost), (0, 0))
 
         # Draw all buttons
         for button in self.buttons:
-            self._draw_button(draw, button)
+            self._draw_button(draw, image, button)
 
         return image
 
+    def _status_bar_tile(self, width: int, height: int, connected: bool,
+                         model: str, cost: float) -> Image.Image:
+        """
+        Get the rendered status bar for the given content.
+
+        The bar only changes when the connection, model or displayed cost
+        changes, so each variant is rasterized once and pasted afterwards.
+        """
+        key = (width, height, connected, model, f"{cost:.4f}", cost > 1.0)
+        tile = self._status_bar_tiles.get(key)
+        if tile is None:
+            if len(self._status_bar_tiles) >= 32:
+                self._status_bar_tiles.clear()
+            # One row taller: the background rectangle covers y=height too
+            tile = Image.new("RGB", (width, height + 1), COLORS["background"])
+            self._draw_status_bar(ImageDraw.Draw(tile, 'RGBA'), 0, 0, width, height,
+                                  connected, model, cost)
+            self._status_bar_tiles[key] = tile
+        return tile
+
     def _draw_status_bar(self, draw: ImageDraw.Draw, x: int, y: int,
                          width: int, height: int, connected: bool,
                          model: str, cost: float):
@@ -308,17 +331,15 @@ class CommandPanel:
             width=1
         )
 
-    def _draw_button(self, draw: ImageDraw.Draw, button: CommandButton):
+    def _draw_button(self, draw: ImageDraw.Draw, image: Image.Image, button: CommandButton):
         """Draw a single button."""
         state_style = STATE_COLORS.get(button.state, STATE_COLORS["normal"])
 
         x1, y1 = button.x, button.y
         x2, y2 = button.x + button.width, button.y + button.height
 
-        # Button background
-        draw.rectangle([x1, y1, x2, y2], fill=state_style["bg"])
-
-        # Glow effect for active states
+        # Glow effect for active states (outside the button face, so it is
+        # drawn live over whatever lies beneath)
         if state_style["glow"]:
             border_color = state_style["border"]
             # Outer glow
@@ -331,6 +352,54 @@ class CommandPanel:
                     width=1
                 )
 
+        # Background, border, corner accents and label from the tile cache
+        tile = self._button_tile(button, state_style)
+        image.paste(tile, (x1 - 1, y1 - 1), tile)
+
+        # Running state gets animated dots
+        if button.state == "running":
+            label_x, label_y, label_width = self._label_layout(button)
+            dots = "..." [:int(time.time() * 3) % 4]
+            dot_font = self.theme.get_font("mono", "small")
+            draw.text(
+                (x1 + label_x + label_width + 4, y1 + label_y),
+                dots,
+                font=dot_font,
+                fill=state_style["text"]
+            )
+
+    def _label_layout(self, button: CommandButton):
+        """Get the centered label position (relative to the button) and width."""
+        font = self.theme.get_font("bold", "medium")
+        label_bbox = text_bbox(font, button.label)
+        label_width = label_bbox[2] - label_bbox[0]
+        label_height = label_bbox[3] - label_bbox[1]
+
+        label_x = (button.width - label_width) // 2
+        label_y = (button.height - label_height) // 2 - 2
+        return label_x, label_y, label_width
+
+    def _button_tile(self, button: CommandButton, state_style: dict) -> Image.Image:
+        """
+        Get the pre-rendered face of a button in its current state.
+
+        The face only changes with label, state and size, so it is rasterized
+        once per combination and pasted on every later frame. The tile has a
+        transparent 1px margin for the corner accents that overhang the edge.
+        """
+        key = (button.label, button.state, button.width, button.height)
+        tile = self._button_tiles.get(key)
+        if tile is not None:
+            return tile
+
+        x1, y1 = 1, 1
+        x2, y2 = button.width + 1, button.height + 1
+        tile = Image.new("RGBA", (x2 + 2, y2 + 2), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile, 'RGBA')
+
+        # Button background
+        draw.rectangle([x1, y1, x2, y2], fill=state_style["bg"])
+
         # Border
         draw.rectangle(
             [x1, y1, x2, y2],
@@ -355,32 +424,16 @@ class CommandPanel:
         draw.line([(x2, y2 - accent_len), (x2, y2)], fill=accent_color, width=3)
 
         # Button label (centered)
-        font = self.theme.get_font("bold", "medium")
-        label_bbox = font.getbbox(button.label)
-        label_width = label_bbox[2] - label_bbox[0]
-        label_height = label_bbox[3] - label_bbox[1]
-
-        label_x = x1 + (button.width - label_width) // 2
-        label_y = y1 + (button.height - label_height) // 2 - 2
-
+        label_x, label_y, _ = self._label_layout(button)
         draw.text(
-            (label_x, label_y),
+            (x1 + label_x, y1 + label_y),
             button.label,
-            font=font,
+            font=self.theme.get_font("bold", "medium"),
             fill=state_style["text"]
         )
 
-        # Running state gets animated dots
-        if button.state == "running":
-            dots = "..." [:int(time.time() * 3) % 4]
-            dot_font = self.theme.get_font("mono", "small")
-            dot_y = y2 - 16
-            draw.text(
-                (label_x + label_width + 4, label_y),
-                dots,
-                font=dot_font,
-                fill=state_style["text"]
-            )
+        self._button_tiles[key] = tile
+        return tile
 
     def apply_scanlines(self, image: Image.Image, spacing: int = 2,
                         opacity: int = 20) -> Image.Image:
@@ -395,10 +448,13 @@ class CommandPanel:
         Returns:
             Image with scanlines
         """
-        draw = ImageDraw.Draw(image, 'RGBA')
-        width, height = image.size
-
-        for y in range(0, height, spacing):
-            draw.line([(0, y), (width, y)], fill=(0, 0, 0, opacity))
+        key = (image.size, spacing, opacity)
+        mask = self._scanline_masks.get(key)
+        if mask is None:
+            mask = self.theme.scanline_mask(image.size, spacing=spacing, opacity=opacity)
+            self._scanline_masks[key] = mask
+
+        # One masked paste of black instead of a line draw per row
+        image.paste((0, 0, 0), (0, 0), mask)
 
         return image
@@ -3,6 +3,7 @@ Cyberpunk theme for OpenClaw Dual Display Command Center.
 Colors, fonts, and visual effects (glow, scanlines, glitch).
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import random
 
@@ -54,6 +55,58 @@ COLORS_DIM = {
 }
 
 
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """
+    Load a TrueType font, cached by (path, size).
+
+    Parsing a TTF and creating a FreeType face is expensive; every theme and
+    display instance shares the same font objects through this cache.
+    """
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=256)
+def text_bbox(font, text):
+    """
+    Get a text bounding box, memoized by (font, text).
+
+    Labels and clock strings repeat across many frames, so this avoids
+    re-shaping the same glyphs through FreeType on every render.
+    """
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=64)
+def neon_text_sprite(text, font, color, glow_color, glow_layers):
+    """
+    Rasterize neon text once as an RGBA sprite, memoized by its arguments.
+
+    The halo is the text mask dilated and Gaussian-blurred in C rather than
+    the text redrawn at several offsets.
+
+    Returns:
+        (sprite, pad) - paste the sprite at (x - pad, y - pad)
+    """
+    pad = glow_layers * 3
+    left, top, right, bottom = text_bbox(font, text)
+    size = (right + 2 * pad, bottom + 2 * pad)
+
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).text((pad, pad), text, font=font, fill=255)
+
+    glow = mask
+    if glow_layers > 0:
+        glow = mask.filter(ImageFilter.MaxFilter(2 * glow_layers + 1))
+        glow = glow.filter(ImageFilter.GaussianBlur(glow_layers))
+        glow = glow.point(lambda v: v * 100 // 255)
+
+    sprite = Image.new("RGBA", size, (*glow_color[:3], 0))
+    sprite.putalpha(glow)
+    sprite.paste((*color[:3], 255), (0, 0), mask)
+    return sprite, pad
+
+
 class CyberpunkTheme:
     """Renderer for cyberpunk visual effects."""
 
@@ -79,13 +132,13 @@ class CyberpunkTheme:
 
         try:
             for size_name, size in sizes.items():
-                self.fonts[f"regular_{size_name}"] = ImageFont.truetype(
+                self.fonts[f"regular_{size_name}"] = load_font(
                     font_paths["default"], size
                 )
-                self.fonts[f"bold_{size_name}"] = ImageFont.truetype(
+                self.fonts[f"bold_{size_name}"] = load_font(
                     font_paths["bold"], size
                 )
-                self.fonts[f"mono_{size_name}"] = ImageFont.truetype(
+                self.fonts[f"mono_{size_name}"] = load_font(
                     font_paths["mono"], size
                 )
         except (IOError, OSError):
@@ -120,6 +173,27 @@ class CyberpunkTheme:
 
         return image
 
+    def scanline_mask(self, size, spacing=2, opacity=25):
+        """
+        Build the scanline pattern as an "L" mask for repeated use.
+
+        Pasting black through this mask gives the same result as
+        draw_scanlines() in a single C-level blend.
+
+        Args:
+            size: (width, height) of the area to cover
+            spacing: Pixels between scanlines
+            opacity: Scanline darkness (0-255)
+        """
+        mask = Image.new("L", size, 0)
+        draw = ImageDraw.Draw(mask)
+        width, height = size
+
+        for y in range(0, height, spacing):
+            draw.line([(0, y), (width, y)], fill=opacity)
+
+        return mask
+
     def draw_glow(self, draw, shape_type, coords, color, layers=2, base_width=1):
         """
         Draw a shape with outer glow effect.
@@ -202,6 +276,28 @@ class CyberpunkTheme:
         # Draw main text
         draw.text(pos, text, font=font, fill=color)
 
+    def paste_neon_text(self, image, pos, text, font, color, glow_layers=1):
+        """
+        Composite neon text onto an image from a cached sprite.
+
+        Same arguments as draw_neon_text(), but takes the target image so
+        repeated labels cost one paste instead of several rasterizations.
+
+        Args:
+            image: PIL Image to draw on
+            pos: (x, y) position
+            text: Text string
+            font: PIL font
+            color: Main text color
+            glow_layers: Glow radius in pixels
+        """
+        dim_color = COLORS_DIM.get(
+            self._find_color_name(color),
+            tuple(c // 2 for c in color)
+        )
+        sprite, pad = neon_text_sprite(text, font, tuple(color), tuple(dim_color), glow_layers)
+        image.paste(sprite, (pos[0] - pad, pos[1] - pad), sprite)
+
     def draw_glitch_effect(self, image, intensity=2):
         """
         Apply RGB channel split glitch effect.